@@ -194,7 +194,10 @@ export const config = {
     maxPerHour: parseInt(process.env.FK_SI_MAX_PER_HOUR || '3'),
     maxPerDay: parseInt(process.env.FK_SI_MAX_PER_DAY || '10'),
     pauseOnConsecutiveFailures: parseInt(process.env.FK_SI_PAUSE_ON_FAILURES || '3'),
+    // Suites may be chained with '&&'; they run in order, stopping at the first
+    // failure, unless testParallel is set for suites that are independent
     testCommand: process.env.FK_SI_TEST_COMMAND || 'node tests/run-all.js',
+    testParallel: process.env.FK_SI_TEST_PARALLEL === '1',
     testTimeoutMs: parseInt(process.env.FK_SI_TEST_TIMEOUT_MS || '60000'),
     digestIntervalDays: parseInt(process.env.FK_SI_DIGEST_INTERVAL_DAYS || '7'),
   },
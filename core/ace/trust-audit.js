@@ -26,6 +26,9 @@ const AUDIT_LOG_PATH = path.join(
   'ace_audit_log.jsonl'
 );
 
+// Report icon per warning severity (anything else renders as low)
+const SEVERITY_ICONS = { high: '🔴', medium: '🟡' };
+
 // Audit state
 let auditState = {
   consecutiveApprovals: 0,
@@ -400,7 +403,7 @@ export function formatAuditReport(report) {
   if (report.warnings.length > 0) {
     lines.push('**⚠️ Warnings**');
     for (const warning of report.warnings) {
-      const icon = warning.severity === 'high' ? '🔴' : warning.severity === 'medium' ? '🟡' : '🟢';
+      const icon = SEVERITY_ICONS[warning.severity] ?? '🟢';
       lines.push(`${icon} ${warning.message}`);
     }
     lines.push('');
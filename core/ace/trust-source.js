@@ -47,6 +47,16 @@ export const BLAST_RADIUS_MODIFIERS = {
   [TRUST_LEVELS.TRUSTED]: { bonus: 0.1 },
 };
 
+/**
+ * Rank of each trust level (higher is more trusted), for picking the lowest
+ */
+const TRUST_RANK = {
+  [TRUST_LEVELS.TRUSTED]: 3,
+  [TRUST_LEVELS.VERIFIED]: 2,
+  [TRUST_LEVELS.UNTRUSTED]: 1,
+  [TRUST_LEVELS.HOSTILE]: 0,
+};
+
 /**
  * Patterns that indicate hostile content (prompt injection attempts)
  * Integrated with T422 external content security
@@ -245,13 +255,6 @@ export function validateChain(source, knownSources = new Map()) {
     };
   }
 
-  const levelRanking = {
-    [TRUST_LEVELS.TRUSTED]: 3,
-    [TRUST_LEVELS.VERIFIED]: 2,
-    [TRUST_LEVELS.UNTRUSTED]: 1,
-    [TRUST_LEVELS.HOSTILE]: 0,
-  };
-
   let lowestRank = 3;
   let lowestLevel = TRUST_LEVELS.TRUSTED;
   const untrustedLinks = [];
@@ -275,7 +278,7 @@ export function validateChain(source, knownSources = new Map()) {
       }
     }
 
-    const rank = levelRanking[linkLevel] ?? 1;
+    const rank = TRUST_RANK[linkLevel] ?? 1;
     if (rank < lowestRank) {
       lowestRank = rank;
       lowestLevel = linkLevel;
@@ -349,17 +352,10 @@ export function escalateOnHostile(source, content) {
  * @returns {Object} - Merged source
  */
 export function mergeSources(source1, source2) {
-  const levelRanking = {
-    [TRUST_LEVELS.TRUSTED]: 3,
-    [TRUST_LEVELS.VERIFIED]: 2,
-    [TRUST_LEVELS.UNTRUSTED]: 1,
-    [TRUST_LEVELS.HOSTILE]: 0,
-  };
-
   const level1 = getTrustLevel(source1);
   const level2 = getTrustLevel(source2);
 
-  const lowerLevel = levelRanking[level1] <= levelRanking[level2] ? level1 : level2;
+  const lowerLevel = TRUST_RANK[level1] <= TRUST_RANK[level2] ? level1 : level2;
 
   return {
     type: SOURCE_TYPES.AGENT, // Merged content comes from agent processing
@@ -160,12 +160,16 @@ export async function spawnIsolatedAgent(task) {
     let stdout = '';
     let stderr = '';
 
+    // Decode as a stream so multi-byte characters split across chunks survive
+    child.stdout.setEncoding('utf8');
+    child.stderr.setEncoding('utf8');
+
     child.stdout.on('data', (data) => {
-      stdout += data.toString();
+      stdout += data;
     });
 
     child.stderr.on('data', (data) => {
-      stderr += data.toString();
+      stderr += data;
     });
 
     // Handle completion
@@ -90,8 +90,13 @@ function runClaude(task) {
       stdio: ['pipe', 'pipe', 'pipe'],
     });
 
+    // Decode as a stream so multi-byte characters split across chunks
+    // survive, without a Buffer-to-string conversion per chunk
+    proc.stdout.setEncoding('utf8');
+    proc.stderr.setEncoding('utf8');
+
     proc.stdout.on('data', (data) => {
-      output += data.toString();
+      output += data;
       // Send progress updates
       parentPort.postMessage({
         type: 'task_progress',
@@ -102,7 +107,7 @@ function runClaude(task) {
     });
 
     proc.stderr.on('data', (data) => {
-      errorOutput += data.toString();
+      errorOutput += data;
     });
 
     // Timeout handler
@@ -1,6 +1,7 @@
 // Atomic file write utilities for Forgekeeper
 // Prevents file corruption on crash by writing to a temp file then renaming.
 import { writeFileSync, renameSync, mkdirSync, appendFileSync } from 'fs';
+import { writeFile, rename, mkdir } from 'fs/promises';
 import { dirname, join } from 'path';
 
 /**
@@ -21,7 +22,6 @@ export function atomicWriteFileSync(filePath, data, encoding = 'utf-8') {
  * Async version of atomic write.
  */
 export async function atomicWriteFile(filePath, data, encoding = 'utf-8') {
-  const { writeFile, rename, mkdir } = await import('fs/promises');
   const dir = dirname(filePath);
   await mkdir(dir, { recursive: true });
 
@@ -5,10 +5,10 @@
  * are fed back into subsequent reflections for learning.
  */
 
-import { existsSync, readFileSync, appendFileSync, mkdirSync } from 'fs';
+import { existsSync, appendFileSync, mkdirSync } from 'fs';
 import { join } from 'path';
 import { config } from '../config.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { rotateIfNeeded, readLastN } from './jsonl-rotate.js';
 
 // Configuration
 const PERSONALITY_PATH = config.autonomous?.personalityPath || 'forgekeeper_personality';
@@ -18,6 +18,10 @@ const ACTION_OUTCOMES_PATH = join(JOURNAL_DIR, 'action_outcomes.jsonl');
 // Settings
 const STUCK_THRESHOLD_MS = config.autonomousFeedback?.stuckThresholdMs ?? 30 * 60 * 1000; // 30 minutes
 
+// Sort rank per task priority (unknown priorities rank as medium)
+const PRIORITY_RANK = { critical: 0, high: 1, medium: 2, low: 3 };
+const DEFAULT_PRIORITY_RANK = PRIORITY_RANK.medium;
+
 // State for tracking
 let lastOutcome = null;
 let autonomousStats = {
@@ -74,11 +78,9 @@ export function prioritizeTasks(tasks) {
  * Sort tasks by priority and creation date
  */
 function sortByPriorityAndAge(tasks) {
-  const priorityOrder = { critical: 0, high: 1, medium: 2, low: 3 };
-
   return tasks.sort((a, b) => {
-    const aPriority = priorityOrder[a.priority] ?? 2;
-    const bPriority = priorityOrder[b.priority] ?? 2;
+    const aPriority = PRIORITY_RANK[a.priority] ?? DEFAULT_PRIORITY_RANK;
+    const bPriority = PRIORITY_RANK[b.priority] ?? DEFAULT_PRIORITY_RANK;
     if (aPriority !== bPriority) return aPriority - bPriority;
     return new Date(a.created) - new Date(b.created);
   });
@@ -143,28 +145,8 @@ export function getLastOutcome() {
  * Get recent outcomes from journal
  */
 export function getRecentOutcomes(limit = 5) {
-  if (!existsSync(ACTION_OUTCOMES_PATH)) return [];
-
-  try {
-    const lines = readFileSync(ACTION_OUTCOMES_PATH, 'utf-8')
-      .trim()
-      .split('\n')
-      .filter(Boolean);
-
-    return lines
-      .slice(-limit)
-      .map(line => {
-        try {
-          return JSON.parse(line);
-        } catch {
-          return null;
-        }
-      })
-      .filter(Boolean)
-      .reverse();
-  } catch {
-    return [];
-  }
+  // Tail read: only the end of the log is touched, however long it grows
+  return readLastN(ACTION_OUTCOMES_PATH, limit).reverse();
 }
 
 /**
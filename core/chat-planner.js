@@ -92,32 +92,54 @@ OR for simple requests:
   }
 }
 
-// Execute subtasks and aggregate results
+// Upper bound on subtasks run per message; the decomposition prompt asks for 2-5
+const MAX_SUBTASKS = 5;
+
+// Run a single subtask, folding failures into a result record
+async function runSubtask(subtask, chatFn, userId) {
+  console.log(`[ChatPlanner] Running: ${subtask.description.slice(0, 50)}...`);
+
+  try {
+    const result = await chatFn(subtask.description, userId);
+    return {
+      description: subtask.description,
+      type: subtask.type,
+      success: !!result.reply,
+      output: result.reply || result.error || 'No response'
+    };
+  } catch (error) {
+    return {
+      description: subtask.description,
+      type: subtask.type,
+      success: false,
+      output: `Error: ${error.message}`
+    };
+  }
+}
+
+// Execute subtasks and aggregate results.
+// Subtasks share the user's chat session, so they run one at a time.
+// Anything past the cap is reported as skipped rather than silently dropped.
 export async function executeSubtasks(subtasks, chatFn, userId) {
-  console.log(`[ChatPlanner] Executing ${subtasks.length} subtasks...`);
+  const batch = subtasks.slice(0, MAX_SUBTASKS);
+  if (batch.length < subtasks.length) {
+    console.log(`[ChatPlanner] Capping ${subtasks.length} subtasks at ${MAX_SUBTASKS}`);
+  }
+  console.log(`[ChatPlanner] Executing ${batch.length} subtasks...`);
 
   const results = [];
+  for (const subtask of batch) {
+    results.push(await runSubtask(subtask, chatFn, userId));
+  }
 
-  // Execute subtasks - could be parallelized in future
-  for (const subtask of subtasks) {
-    console.log(`[ChatPlanner] Running: ${subtask.description.slice(0, 50)}...`);
-
-    try {
-      const result = await chatFn(subtask.description, userId);
-      results.push({
-        description: subtask.description,
-        type: subtask.type,
-        success: !!result.reply,
-        output: result.reply || result.error || 'No response'
-      });
-    } catch (error) {
-      results.push({
-        description: subtask.description,
-        type: subtask.type,
-        success: false,
-        output: `Error: ${error.message}`
-      });
-    }
+  for (const subtask of subtasks.slice(MAX_SUBTASKS)) {
+    results.push({
+      description: subtask.description,
+      type: subtask.type,
+      success: false,
+      skipped: true,
+      output: `Skipped: only the first ${MAX_SUBTASKS} subtasks run per message`
+    });
   }
 
   return results;
@@ -125,27 +147,23 @@ export async function executeSubtasks(subtasks, chatFn, userId) {
 
 // Format aggregated results for user
 export function formatResults(results, aggregation) {
-  const successful = results.filter(r => r.success);
-  const failed = results.filter(r => !r.success);
-
-  let response = '';
-
-  if (aggregation) {
-    response += `${aggregation}\n\n`;
-  }
-
-  for (const result of successful) {
-    response += `## ${result.description}\n${result.output}\n\n`;
+  // Single pass over results; sections are collected and joined once.
+  const parts = aggregation ? [`${aggregation}\n\n`] : [];
+  const failures = [];
+
+  for (const result of results) {
+    if (result.success) {
+      parts.push(`## ${result.description}\n${result.output}\n\n`);
+    } else {
+      failures.push(`- ${result.description}: ${result.output}\n`);
+    }
   }
 
-  if (failed.length > 0) {
-    response += `---\n⚠️ Some subtasks had issues:\n`;
-    for (const result of failed) {
-      response += `- ${result.description}: ${result.output}\n`;
-    }
+  if (failures.length > 0) {
+    parts.push(`---\n⚠️ Some subtasks had issues:\n`, ...failures);
   }
 
-  return response.trim();
+  return parts.join('').trim();
 }
 
 // Main entry point - process a chat message through the planner
@@ -226,6 +226,10 @@ If you encountered errors, explain what went wrong and any recovery attempted.`)
   return parts.join('\n\n');
 }
 
+// Common tech terms to prioritize when extracting tags
+const TECH_TERMS = new Set(['react', 'node', 'python', 'deploy', 'test', 'build', 'git',
+                            'api', 'database', 'docker', 'kubernetes', 'aws', 'auth']);
+
 // Extract tags from task description for learning lookup
 function extractTags(text) {
   const keywords = text.toLowerCase()
@@ -233,11 +237,11 @@ function extractTags(text) {
     .split(/\s+/)
     .filter(w => w.length > 3);
 
-  // Common tech terms to prioritize
-  const techTerms = ['react', 'node', 'python', 'deploy', 'test', 'build', 'git',
-                     'api', 'database', 'docker', 'kubernetes', 'aws', 'auth'];
+  // A keyword whose first occurrence is among the first ten is in this set;
+  // a Set lookup replaces the per-keyword indexOf scan
+  const leading = new Set(keywords.slice(0, 10));
 
-  return keywords.filter(k => techTerms.includes(k) || keywords.indexOf(k) < 10);
+  return keywords.filter(k => TECH_TERMS.has(k) || leading.has(k));
 }
 
 // Quick query - for simple questions that don't need full task treatment
@@ -540,7 +544,7 @@ function runClaudeCommand(message, options = {}) {
     console.log(`[Claude] Timeout type: ${timeoutType} (idle: ${effectiveIdleTimeout/1000}s, max: ${effectiveMaxTimeout/1000}s)`);
 
     let settled = false;
-    let rawOutput = '';       // Raw streaming JSON lines
+    const rawChunks = [];     // Raw streaming JSON, joined only if no text was extracted
     let textContent = '';     // Extracted text content for response
     let stderr = '';
     let lastActivityTime = Date.now();
@@ -578,22 +582,30 @@ function runClaudeCommand(message, options = {}) {
       }
     }, 1000);
 
-    proc.stdout.on('data', (data) => {
-      const chunk = data.toString();
-      rawOutput += chunk;
-      lastActivityTime = Date.now();  // Reset idle timer on ANY output
+    // Decode as UTF-8 in the stream so multi-byte characters split across
+    // chunks are reassembled before they reach the line parser
+    proc.stdout.setEncoding('utf8');
 
-      // Parse streaming JSON - each line is a separate event
-      streamBuffer += chunk;
+    proc.stdout.on('data', (chunk) => {
+      rawChunks.push(chunk);
+      lastActivityTime = Date.now();  // Reset idle timer on ANY output
 
-      // Guard against unbounded buffer growth (e.g., if newlines never arrive)
-      if (streamBuffer.length > 1024 * 1024) {
-        console.warn(`[Claude] Stream buffer exceeded 1MB (${streamBuffer.length} bytes), discarding`);
-        streamBuffer = '';
+      // Parse streaming JSON - each line is a separate event.
+      // A chunk without a newline only extends the pending line, so large
+      // events arriving in many chunks aren't re-split on every chunk.
+      const lastNewline = chunk.lastIndexOf('\n');
+      if (lastNewline === -1) {
+        streamBuffer += chunk;
+        // Guard against unbounded buffer growth (e.g., if newlines never arrive)
+        if (streamBuffer.length > 1024 * 1024) {
+          console.warn(`[Claude] Stream buffer exceeded 1MB (${streamBuffer.length} bytes), discarding`);
+          streamBuffer = '';
+        }
+        return;
       }
 
-      const lines = streamBuffer.split('\n');
-      streamBuffer = lines.pop() || '';  // Keep incomplete line in buffer
+      const lines = (streamBuffer + chunk.slice(0, lastNewline)).split('\n');
+      streamBuffer = chunk.slice(lastNewline + 1);  // Keep incomplete line in buffer
 
       for (const line of lines) {
         if (!line.trim()) continue;
@@ -686,7 +698,7 @@ function runClaudeCommand(message, options = {}) {
         onProgress({ status: 'timeout', elapsed: totalTime, message: 'Maximum time exceeded' });
         resolve({
           success: false,
-          output: textContent || rawOutput,
+          output: textContent || rawChunks.join(''),
           error: `Task exceeded maximum time (${effectiveMaxTimeout/1000}s)`,
           stuckResume: !!options.sessionId,
           elapsed: totalTime
@@ -740,7 +752,7 @@ function runClaudeCommand(message, options = {}) {
         onProgress({ status: 'timeout', elapsed: totalTime, message: 'Connection timed out' });
         resolve({
           success: false,
-          output: textContent || rawOutput,
+          output: textContent || rawChunks.join(''),
           error: timeoutError,
           stuckResume: isSessionCall, // Flag for auto-rotation
           elapsed: totalTime
@@ -770,16 +782,19 @@ function runClaudeCommand(message, options = {}) {
         } catch (e) { /* ignore parse errors */ }
       }
 
-      // DEBUG: Log response
+      // DEBUG: Log response (one write for the whole block)
       const totalTime = Date.now() - startTime;
-      console.log(`[Claude] ========== RESPONSE DEBUG ==========`);
-      console.log(`[Claude] Exit code: ${code}, completed in ${(totalTime/1000).toFixed(1)}s`);
-      console.log(`[Claude] Text content (${textContent.length} chars): "${textContent.slice(0, 500)}${textContent.length > 500 ? '...' : ''}"`);
-      if (stderr) console.log(`[Claude] Stderr: "${stderr.slice(0, 200)}"`);
-      console.log(`[Claude] ========== RESPONSE END ==========`);
+      const debugLines = [
+        `[Claude] ========== RESPONSE DEBUG ==========`,
+        `[Claude] Exit code: ${code}, completed in ${(totalTime/1000).toFixed(1)}s`,
+        `[Claude] Text content (${textContent.length} chars): "${textContent.slice(0, 500)}${textContent.length > 500 ? '...' : ''}"`,
+      ];
+      if (stderr) debugLines.push(`[Claude] Stderr: "${stderr.slice(0, 200)}"`);
+      debugLines.push(`[Claude] ========== RESPONSE END ==========`);
+      console.log(debugLines.join('\n'));
 
       // Use extracted text content, fall back to raw output if parsing failed
-      const output = textContent || rawOutput;
+      const output = textContent || rawChunks.join('');
 
       if (code !== 0) {
         resolve({ success: false, output, error: stderr || `Exit code ${code}` });
@@ -792,7 +807,7 @@ function runClaudeCommand(message, options = {}) {
       if (settled) return;
       settled = true;
       clearInterval(timeoutCheck);
-      resolve({ success: false, output: textContent || rawOutput, error: err.message });
+      resolve({ success: false, output: textContent || rawChunks.join(''), error: err.message });
     });
   });
 }
@@ -16,7 +16,7 @@ import { atomicWriteFileSync } from './atomic-write.js';
 import { join, dirname } from 'path';
 import { config } from '../config.js';
 import { query } from './claude.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { rotateIfNeeded, readLastN } from './jsonl-rotate.js';
 
 // Configuration
 const PERSONALITY_PATH = config.autonomous?.personalityPath || 'forgekeeper_personality';
@@ -199,7 +199,7 @@ export function flushToMemory(extraction, metadata = {}) {
  * Format working memory content
  */
 function formatWorkingMemory(extraction, metadata) {
-  const lines = [
+  return [
     '# Working Memory',
     '',
     `Last updated: ${new Date().toISOString()}`,
@@ -212,9 +212,7 @@ function formatWorkingMemory(extraction, metadata) {
     '---',
     '',
     '*This file is auto-generated by context flush. It will be loaded on startup.*',
-  ];
-
-  return lines.filter(l => l !== null).join('\n');
+  ].join('\n');
 }
 
 /**
@@ -234,12 +232,11 @@ export function loadFlushedContext() {
   try {
     const content = readFileSync(WORKING_MEMORY_PATH, 'utf-8');
 
-    // Extract just the context section (skip header/footer)
-    const lines = content.split('\n');
-    const contextStart = lines.findIndex(l => l.includes('Context from Previous Session'));
-    const contextEnd = lines.findIndex(l => l.startsWith('---'));
+    // Extract just the context section (skip header/footer). Locate it by
+    // offset and slice once rather than splitting the file into lines.
+    const headingAt = content.indexOf('Context from Previous Session');
 
-    if (contextStart === -1) {
+    if (headingAt === -1) {
       return {
         available: true,
         content: content,
@@ -247,8 +244,12 @@ export function loadFlushedContext() {
       };
     }
 
-    const contextLines = lines.slice(contextStart + 2, contextEnd > contextStart ? contextEnd : undefined);
-    const contextContent = contextLines.join('\n').trim();
+    // Body starts after the heading line and the blank line that follows it
+    const headingEnd = content.indexOf('\n', headingAt);
+    const blankEnd = headingEnd === -1 ? -1 : content.indexOf('\n', headingEnd + 1);
+    const bodyStart = blankEnd === -1 ? content.length : blankEnd + 1;
+    const footerAt = content.indexOf('\n---', bodyStart - 1);
+    const contextContent = content.slice(bodyStart, footerAt === -1 ? undefined : footerAt).trim();
 
     return {
       available: true,
@@ -324,28 +325,7 @@ export function getStats() {
  * Get recent flush entries from journal
  */
 export function getRecentFlushes(limit = 5) {
-  if (!existsSync(CONTEXT_FLUSHES_PATH)) return [];
-
-  try {
-    const lines = readFileSync(CONTEXT_FLUSHES_PATH, 'utf-8')
-      .trim()
-      .split('\n')
-      .filter(Boolean);
-
-    return lines
-      .slice(-limit)
-      .map(line => {
-        try {
-          return JSON.parse(line);
-        } catch {
-          return null;
-        }
-      })
-      .filter(Boolean)
-      .reverse();
-  } catch {
-    return [];
-  }
+  return readLastN(CONTEXT_FLUSHES_PATH, limit).reverse();
 }
 
 /**
@@ -1,5 +1,5 @@
 // Conversation Organizer - Summarizes and indexes conversations for quick routing
-import { readFileSync, existsSync, readdirSync } from 'fs';
+import { readFileSync, existsSync, readdirSync, statSync } from 'fs';
 import { join } from 'path';
 import { config } from '../config.js';
 import { query } from './claude.js';
@@ -24,13 +24,36 @@ const CONVERSATIONS_DIR = join(config.dataDir, 'conversations');
 //   }
 // }
 
+// Parsed summaries, reused while the file's inode, size and mtime are
+// unchanged. This module is the only writer and every loader either saves
+// what it changes or only reads, so the object is shared between calls.
+let summariesCache = null;
+
+function fileStamp(filePath) {
+  const stats = statSync(filePath, { bigint: true });
+  return { ino: stats.ino, size: stats.size, mtimeNs: stats.mtimeNs };
+}
+
+function sameStamp(a, b) {
+  return a.ino === b.ino && a.size === b.size && a.mtimeNs === b.mtimeNs;
+}
+
 // Load summaries
 function loadSummaries() {
-  if (!existsSync(SUMMARIES_FILE)) {
+  let stamp;
+  try {
+    stamp = fileStamp(SUMMARIES_FILE);
+  } catch {
+    summariesCache = null;
     return {};
   }
+  if (summariesCache && sameStamp(summariesCache.stamp, stamp)) {
+    return summariesCache.summaries;
+  }
   try {
-    return JSON.parse(readFileSync(SUMMARIES_FILE, 'utf-8'));
+    const summaries = JSON.parse(readFileSync(SUMMARIES_FILE, 'utf-8'));
+    summariesCache = { stamp, summaries };
+    return summaries;
   } catch (error) {
     console.error('[Organizer] Failed to load summaries:', error.message);
     return {};
@@ -40,8 +63,12 @@ function loadSummaries() {
 // Save summaries
 function saveSummaries(summaries) {
   try {
-    atomicWriteFileSync(SUMMARIES_FILE, JSON.stringify(summaries, null, 2));
+    // Rewritten on every message and read only by this module, so skip the
+    // indentation — it roughly doubles the size of a file that keeps growing
+    atomicWriteFileSync(SUMMARIES_FILE, JSON.stringify(summaries));
+    summariesCache = { stamp: fileStamp(SUMMARIES_FILE), summaries };
   } catch (error) {
+    summariesCache = null;
     console.error('[Organizer] Failed to save summaries:', error.message);
   }
 }
@@ -52,8 +79,14 @@ function loadConversation(userId) {
   if (!existsSync(convFile)) return [];
 
   try {
-    const lines = readFileSync(convFile, 'utf-8').split('\n').filter(l => l.trim());
-    return lines.map(l => JSON.parse(l));
+    // One pass over the lines. Every record is a JSON object, so a line
+    // starting with '{' can't be blank and skips the trim() check.
+    const messages = [];
+    for (const line of readFileSync(convFile, 'utf-8').split('\n')) {
+      if (line.charCodeAt(0) !== 123 && !line.trim()) continue;
+      messages.push(JSON.parse(line));
+    }
+    return messages;
   } catch (error) {
     console.error(`[Organizer] Failed to load conversation ${userId}:`, error.message);
     return [];
@@ -161,21 +194,22 @@ export function updateSessionActivity(userId, sessionId, topic, messagePreview)
   saveSummaries(summaries);
 }
 
+// Words too common to be useful as conversation keywords
+const STOP_WORDS = new Set(['the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+  'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+  'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
+  'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
+  'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+  'my', 'your', 'his', 'its', 'our', 'their', 'this', 'that', 'these', 'those',
+  'what', 'which', 'who', 'whom', 'whose', 'where', 'when', 'why', 'how',
+  'can', 'let', 'just', 'now', 'also', 'very', 'really', 'please', 'thanks']);
+
 // Extract keywords from text (simple extraction)
 function extractKeywords(text) {
-  const stopWords = new Set(['the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
-    'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
-    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-    'my', 'your', 'his', 'its', 'our', 'their', 'this', 'that', 'these', 'those',
-    'what', 'which', 'who', 'whom', 'whose', 'where', 'when', 'why', 'how',
-    'can', 'let', 'just', 'now', 'also', 'very', 'really', 'please', 'thanks']);
-
   const words = text.toLowerCase()
     .replace(/[^a-z0-9\s]/g, ' ')
     .split(/\s+/)
-    .filter(w => w.length > 2 && !stopWords.has(w));
+    .filter(w => w.length > 2 && !STOP_WORDS.has(w));
 
   // Count frequency
   const freq = {};
@@ -232,9 +266,8 @@ Respond in JSON format:
   }
 }
 
-// Archive old sessions
-export function archiveOldSessions(userId, maxAgeHours = 24) {
-  const summaries = loadSummaries();
+// Mark a user's stale sessions archived in an already-loaded summaries object
+function archiveStaleSessions(summaries, userId, maxAgeHours) {
   const userSummaries = summaries[userId] || {};
   const now = Date.now();
   let archived = 0;
@@ -253,33 +286,55 @@ export function archiveOldSessions(userId, maxAgeHours = 24) {
   }
 
   if (archived > 0) {
-    saveSummaries(summaries);
     console.log(`[Organizer] Archived ${archived} old sessions for user ${userId}`);
   }
 
   return archived;
 }
 
+// Archive old sessions
+export function archiveOldSessions(userId, maxAgeHours = 24) {
+  const summaries = loadSummaries();
+  const archived = archiveStaleSessions(summaries, userId, maxAgeHours);
+
+  if (archived > 0) {
+    saveSummaries(summaries);
+  }
+
+  return archived;
+}
+
 // Background organization task - run periodically
 export async function organizeConversations() {
   console.log('[Organizer] Starting conversation organization...');
 
-  const summaries = loadSummaries();
   let organized = 0;
 
   // Find all users with conversations
   if (!existsSync(CONVERSATIONS_DIR)) return 0;
 
-  const files = readdirSync(CONVERSATIONS_DIR).filter(f => f.endsWith('.jsonl'));
-
-  for (const file of files) {
-    const userId = file.replace('.jsonl', '');
+  const userIds = readdirSync(CONVERSATIONS_DIR)
+    .filter(f => f.endsWith('.jsonl'))
+    .map(f => f.replace('.jsonl', ''));
 
-    // Archive old sessions
-    archiveOldSessions(userId);
+  // Load the summaries once and archive old sessions for every user in
+  // memory. Archival is saved before summarizing starts so it survives a
+  // failure part-way through the (slow) summarization pass.
+  const summaries = loadSummaries();
+  let archived = 0;
+  for (const userId of userIds) {
+    archived += archiveStaleSessions(summaries, userId, 24);
+  }
+  if (archived > 0) {
+    saveSummaries(summaries);
+  }
 
+  for (const userId of userIds) {
     // Check if any sessions need summarization
     const userSummaries = summaries[userId] || {};
+    // The user's conversation file is read at most once per pass, on the
+    // first session that actually needs summarizing
+    let messages = null;
 
     for (const [sessionId, summary] of Object.entries(userSummaries)) {
       if (summary.status === 'archived') continue;
@@ -289,7 +344,7 @@ export async function organizeConversations() {
         (summary.messageCount > 10 && summary.messageCount > (summary.summarizedMessageCount || 0) + 5);
 
       if (needsSummary) {
-        const messages = loadConversation(userId);
+        messages ??= loadConversation(userId);
         const result = await summarizeSession(userId, sessionId, messages);
 
         if (result) {
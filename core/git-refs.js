@@ -0,0 +1,62 @@
+// Git ref helpers for Forgekeeper
+// Reads refs straight from .git so callers don't spawn a git process per lookup.
+import { readFileSync } from 'fs';
+import { join } from 'path';
+
+// A loose ref file holds a full SHA-1 or SHA-256 object name
+const OBJECT_NAME_RE = /^[0-9a-f]{40,64}$/;
+
+/**
+ * Look up a ref's hash in packed-refs text. Searches the raw string for
+ * " <ref>" at a line end instead of splitting the whole file into lines.
+ * @param {string} packed - Contents of .git/packed-refs
+ * @param {string} ref - Full ref name, e.g. 'refs/heads/main'
+ * @returns {string|null}
+ */
+export function findPackedRef(packed, ref) {
+  const needle = ` ${ref}`;
+  let i = packed.indexOf(needle);
+  while (i !== -1) {
+    const end = i + needle.length;
+    if (end === packed.length || packed.charCodeAt(end) === 10) {
+      const start = packed.lastIndexOf('\n', i) + 1;
+      return packed.slice(start, packed.indexOf(' ', start));
+    }
+    i = packed.indexOf(needle, end);
+  }
+  return null;
+}
+
+/**
+ * Resolve a ref to a commit hash by reading .git directly: HEAD (detached or
+ * symbolic), then the loose ref file, then packed-refs.
+ * Returns null for layouts this doesn't handle (worktrees, symbolic remote
+ * refs, missing refs); callers decide whether to fall back to git.
+ * @param {string} ref - 'HEAD' or a full ref name such as 'refs/remotes/origin/main'
+ * @param {string} [root] - Repository root containing .git
+ * @returns {string|null} commit hash
+ */
+export function readRef(ref, root = '.') {
+  const gitDir = join(root, '.git');
+  try {
+    let name = ref;
+    if (ref === 'HEAD') {
+      const head = readFileSync(join(gitDir, 'HEAD'), 'utf-8').trim();
+      if (!head.startsWith('ref: ')) return OBJECT_NAME_RE.test(head) ? head : null;
+      name = head.slice(5);
+    }
+
+    let loose;
+    try {
+      loose = readFileSync(join(gitDir, name), 'utf-8').trim();
+    } catch {
+      // Ref may only exist in packed-refs
+      return findPackedRef(readFileSync(join(gitDir, 'packed-refs'), 'utf-8'), name);
+    }
+    return OBJECT_NAME_RE.test(loose) ? loose : null;
+  } catch {
+    return null;
+  }
+}
+
+export default { findPackedRef, readRef };
@@ -14,15 +14,17 @@
  *   security:injection-detected
  */
 
-import { existsSync, readFileSync, mkdirSync, appendFileSync, readdirSync } from 'fs';
+import { existsSync, readFileSync, mkdirSync, readdirSync } from 'fs';
 import { join, dirname } from 'path';
 import { pathToFileURL } from 'url';
 import { config } from '../config.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { appendJsonlRecord } from './jsonl-rotate.js';
 import { atomicWriteFileSync } from './atomic-write.js';
 
 // Hook system configuration
 const HOOKS_ENABLED = process.env.FK_HOOKS_ENABLED !== '0';
+// Resolved once: the log-events hook checks it on every fired event
+const HOOKS_DEBUG = config.hooks?.debug ?? process.env.FK_HOOKS_DEBUG === '1';
 // Use hooks config if available, fall back to personality path, then default
 const HOOKS_DIR = config.hooks?.hooksDir ||
   join(config.autonomous?.personalityPath || 'forgekeeper_personality', 'hooks');
@@ -99,7 +101,7 @@ function registerBuiltinHooks() {
   builtinHooks.set('log-events', {
     events: ['*'],
     handler: async (event, context) => {
-      if (process.env.FK_HOOKS_DEBUG === '1') {
+      if (HOOKS_DEBUG) {
         console.log(`[Hooks] Event: ${event}`, JSON.stringify(context).slice(0, 200));
       }
       return null; // Don't modify anything
@@ -260,48 +262,52 @@ export async function fireEvent(event, context = {}) {
         Object.assign(modifications, result);
       }
 
-      executedHooks.push({
-        name: hook.name,
-        source: hook.source,
-        result: result ? 'modified' : 'pass',
-      });
+      executedHooks.push(hookRecord(hook, result ? 'modified' : 'pass'));
     } catch (err) {
       console.error(`[Hooks] Error in hook ${hook.name}: ${err.message}`);
-      executedHooks.push({
-        name: hook.name,
-        source: hook.source,
-        result: 'error',
-        error: err.message,
-      });
+      executedHooks.push(hookRecord(hook, 'error', err.message));
     }
   }
 
   // Log hook execution
   if (executedHooks.length > 0) {
-    logHookEvent({
+    logHookEvent(
       event,
-      hooks: executedHooks,
-      modifications: Object.keys(modifications).length > 0 ? modifications : undefined,
-      durationMs: Date.now() - startTime,
-    });
+      executedHooks,
+      Object.keys(modifications).length > 0 ? modifications : undefined,
+      Date.now() - startTime,
+    );
   }
 
   return modifications;
 }
 
 /**
- * Log hook event to journal
+ * Build a per-hook execution record. Every record has the same fields in the
+ * same order (error is left undefined on success and dropped by
+ * JSON.stringify), so records share one object shape.
+ */
+function hookRecord(hook, result, error = undefined) {
+  return { name: hook.name, source: hook.source, result, error };
+}
+
+/**
+ * Log hook event to journal.
+ * The entry is built in a single literal rather than by spreading an
+ * intermediate object, so there is one allocation with a fixed field order.
  */
-function logHookEvent(eventData) {
+function logHookEvent(event, hooks, modifications, durationMs) {
   try {
     const entry = {
       ts: new Date().toISOString(),
       type: 'hook_event',
-      ...eventData,
+      event,
+      hooks,
+      modifications,
+      durationMs,
     };
 
-    appendFileSync(HOOKS_LOG, JSON.stringify(entry) + '\n');
-    rotateIfNeeded(HOOKS_LOG);
+    appendJsonlRecord(HOOKS_LOG, entry);
   } catch (err) {
     // Silent fail for logging
   }
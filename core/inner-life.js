@@ -297,64 +297,81 @@ async function buildReflectionPrompt({ identity, activeGoals, recentLearnings, r
   return parts.join(' ');
 }
 
+// Intent, sharing and urgency patterns are built once at module load rather
+// than on every call. None use the g flag, so sharing them across .test()
+// calls carries no lastIndex state.
+//
+// Each list is also folded into a single alternation so a check is one
+// regex scan of the thought instead of one per pattern. All lists are
+// case-insensitive and use no backreferences, so the combined test matches
+// exactly when some pattern in the list does.
+function anyOf(patterns) {
+  return new RegExp(patterns.map(p => `(?:${p.source})`).join('|'), 'i');
+}
+
+const ACTION_PATTERNS = [
+  /i (should|want to|need to|could|will)/i,
+  /let me/i,
+  /i('ll| will) (try|check|look|work on)/i,
+  /next (step|i should)/i,
+];
+const ACTION_RE = anyOf(ACTION_PATTERNS);
+
 // Detect if the thought suggests wanting to take action
 function detectActionIntent(thought) {
-  const actionPhrases = [
-    /i (should|want to|need to|could|will)/i,
-    /let me/i,
-    /i('ll| will) (try|check|look|work on)/i,
-    /next (step|i should)/i,
-  ];
-
-  return actionPhrases.some(p => p.test(thought));
+  return ACTION_RE.test(thought);
 }
 
+const SHARING_PATTERNS = [
+  /i (discovered|found|realized|learned|noticed)/i,
+  /interesting|exciting|important|curious/i,
+  /want(ed)? to (tell|share|show|ask)/i,
+  /hey rado|rado,/i,
+  /breakthrough|insight|idea/i,
+  /you might (like|want|be interested)/i,
+];
+const SHARING_RE = anyOf(SHARING_PATTERNS);
+
 // Detect if a thought is worth sharing proactively
 function isWorthSharing(thought) {
-  const sharingIndicators = [
-    /i (discovered|found|realized|learned|noticed)/i,
-    /interesting|exciting|important|curious/i,
-    /want(ed)? to (tell|share|show|ask)/i,
-    /hey rado|rado,/i,
-    /breakthrough|insight|idea/i,
-    /you might (like|want|be interested)/i,
-  ];
-
-  return sharingIndicators.some(p => p.test(thought));
+  return SHARING_RE.test(thought);
 }
 
+const URGENT_PATTERNS = [
+  /error|fail|broken|crash|down/i,
+  /security|vulnerab|attack|breach/i,
+  /urgent|asap|immediately|critical/i,
+  /blocking|blocked|stuck.*need/i,
+  /lost|deleted|missing.*important/i,
+];
+const URGENT_RE = anyOf(URGENT_PATTERNS);
+
+const LOW_PRIORITY_PATTERNS = [
+  /quiet|calm|peaceful/i,
+  /noticed.*sitting|been.*while/i,  // "noticed X sitting there for a while" = low urgency observation
+  /uncommitted.*changes/i,           // This specific case that triggered 3 messages
+  /just.*checking|checking in/i,
+  /wonder(ing)?|curious(?!.*found)/i, // Curiosity without discovery
+];
+const LOW_PRIORITY_RE = anyOf(LOW_PRIORITY_PATTERNS);
+
 // Classify urgency of a message - determines if it can bypass cooldown
 // Returns: 'urgent' (bypass cooldown), 'normal' (respect cooldown), 'low' (longer cooldown)
 function classifyUrgency(thought) {
-  const urgentPatterns = [
-    /error|fail|broken|crash|down/i,
-    /security|vulnerab|attack|breach/i,
-    /urgent|asap|immediately|critical/i,
-    /blocking|blocked|stuck.*need/i,
-    /lost|deleted|missing.*important/i,
-  ];
-
-  const lowPriorityPatterns = [
-    /quiet|calm|peaceful/i,
-    /noticed.*sitting|been.*while/i,  // "noticed X sitting there for a while" = low urgency observation
-    /uncommitted.*changes/i,           // This specific case that triggered 3 messages
-    /just.*checking|checking in/i,
-    /wonder(ing)?|curious(?!.*found)/i, // Curiosity without discovery
-  ];
-
-  if (urgentPatterns.some(p => p.test(thought))) {
+  if (URGENT_RE.test(thought)) {
     return 'urgent';
   }
-  if (lowPriorityPatterns.some(p => p.test(thought))) {
+  if (LOW_PRIORITY_RE.test(thought)) {
     return 'low';
   }
   return 'normal';
 }
 
 // Get recent proactive messages from journal
-// Uses readLastN with a larger window then post-filters, since proactive messages are sparse
+// Uses readLastN with a larger window then post-filters, since proactive messages are sparse.
+// The substring prefilter skips JSON.parse for the other entry types.
 function getRecentProactiveMessages(limit = 10) {
-  const recentEntries = readLastN(JOURNAL_PATH, 200);
+  const recentEntries = readLastN(JOURNAL_PATH, 200, { includes: '"type":"proactive_message"' });
   return recentEntries
     .filter(entry => entry?.type === 'proactive_message')
     .slice(-limit);
@@ -388,30 +405,29 @@ const COOLDOWN_BY_URGENCY = {
   low: 12 * 60 * 60 * 1000,    // 12 hours - low priority observations
 };
 
-function hasRecentlySentAbout(message, lookbackCount = 20) {
-  const recentMessages = getRecentProactiveMessages(lookbackCount);
+// Callers that already have the urgency and recent messages pass them in
+function hasRecentlySentAbout(message, urgency = classifyUrgency(message), recentMessages = getRecentProactiveMessages(20)) {
   if (recentMessages.length === 0) return false;
 
   const newTopics = extractTopics(message);
   if (newTopics.length === 0) return false; // No specific topics to match, allow it
 
-  const urgency = classifyUrgency(message);
   const cooldownMs = COOLDOWN_BY_URGENCY[urgency];
   const now = Date.now();
 
   for (const prev of recentMessages) {
+    // Time-based check first: messages outside the cooldown can't suppress,
+    // so skip extracting their topics
+    const prevTime = new Date(prev.timestamp).getTime();
+    const timeSince = now - prevTime;
+    if (!(timeSince < cooldownMs)) continue;
+
     const prevTopics = extractTopics(prev.content || '');
     if (prevTopics.length === 0) continue;
 
     // Check if ANY topic overlaps with a recent message within cooldown period
     const overlap = newTopics.filter(t => prevTopics.includes(t));
-    if (overlap.length === 0) continue;
-
-    // Time-based check: if we sent about this topic recently, suppress
-    const prevTime = new Date(prev.timestamp).getTime();
-    const timeSince = now - prevTime;
-
-    if (timeSince < cooldownMs) {
+    if (overlap.length > 0) {
       const hoursAgo = (timeSince / (60 * 60 * 1000)).toFixed(1);
       console.log(`[InnerLife] Skipping (${urgency}) - sent about "${overlap.join(', ')}" ${hoursAgo}h ago (cooldown: ${cooldownMs / (60 * 60 * 1000)}h)`);
       return true;
@@ -422,11 +438,9 @@ function hasRecentlySentAbout(message, lookbackCount = 20) {
 }
 
 // Check if the last proactive message got a response
-function lastProactiveGotResponse() {
-  const recentMessages = getRecentProactiveMessages(1);
-  if (recentMessages.length === 0) return true; // No previous message, ok to send
+function lastProactiveGotResponse(lastProactive = getRecentProactiveMessages(1)[0]) {
+  if (!lastProactive) return true; // No previous message, ok to send
 
-  const lastProactive = recentMessages[0];
   const lastProactiveTime = new Date(lastProactive.timestamp).getTime();
 
   // Check conversation history for a user message after our last proactive
@@ -470,15 +484,18 @@ async function sendProactiveMessage(message) {
     return { sent: false, reason: 'Rate limited' };
   }
 
+  // One journal read serves both the acknowledgement and duplicate-topic checks
+  const recentMessages = getRecentProactiveMessages(20);
+
   // Don't send another proactive message if the last one wasn't acknowledged
   // (unless it's urgent)
-  if (urgency !== 'urgent' && !lastProactiveGotResponse()) {
+  if (urgency !== 'urgent' && !lastProactiveGotResponse(recentMessages.at(-1))) {
     console.log('[InnerLife] Skipping - last proactive message not yet acknowledged');
     return { sent: false, reason: 'Awaiting response to previous message' };
   }
 
   // Check for duplicate topics (don't bug Rado about the same thing repeatedly)
-  if (hasRecentlySentAbout(message)) {
+  if (hasRecentlySentAbout(message, urgency, recentMessages)) {
     return { sent: false, reason: 'Already sent about this topic recently' };
   }
 
@@ -1,12 +1,195 @@
 // JSONL file rotation for Forgekeeper
 // Prevents unbounded growth of append-only log files.
-import { readFileSync, writeFileSync, renameSync, existsSync, statSync, unlinkSync } from 'fs';
+import {
+  readFileSync, writeFileSync, renameSync, existsSync, statSync, unlinkSync,
+  openSync, writeSync, readSync, closeSync, fstatSync, fdatasyncSync,
+} from 'fs';
 import { atomicWriteFileSync } from './atomic-write.js';
 
 // Default: rotate when file exceeds 2MB, keep 2 rotated copies
 const DEFAULT_MAX_BYTES = 2 * 1024 * 1024; // 2MB
 const DEFAULT_MAX_ROTATIONS = 2;
 
+// Cached append handles: filePath -> { fd, ino, size, checkedAt, dirty }
+// Bursty appenders (conversations, task index) reuse one O_APPEND fd instead
+// of open+write+close per record. Handles are revalidated against the path
+// at most once per WRITER_REVALIDATE_MS so a file replaced or rotated by
+// another process is picked up; in-process replacements must call
+// releaseJsonlWriter(). The tracked size lets appends skip the per-call
+// stat in rotateIfNeeded until the file actually nears its limit.
+const writers = new Map();
+const MAX_OPEN_WRITERS = 32;
+const WRITER_REVALIDATE_MS = 1000;
+
+// Group commit: when FK_JSONL_FSYNC_MS is set, handles written since the last
+// tick are fdatasync'd on that interval, bounding data loss on power failure
+// to one interval without paying an fsync per record. Off by default, which
+// matches plain appendFileSync (no fsync at all). Callers that need a record
+// on disk before continuing pass { sync: true } to the append functions.
+const FSYNC_INTERVAL_MS = parseInt(process.env.FK_JSONL_FSYNC_MS || '0');
+let fsyncTimer = null;
+
+// Block size for reading files backwards in readLastN
+const TAIL_BLOCK_BYTES = 64 * 1024;
+
+/**
+ * Get (or open) the cached append handle for a path
+ */
+function getWriter(filePath) {
+  const now = Date.now();
+  let writer = writers.get(filePath);
+
+  if (writer && now - writer.checkedAt >= WRITER_REVALIDATE_MS) {
+    let stats = null;
+    try {
+      stats = statSync(filePath);
+    } catch {
+      // File removed underneath us — reopen below
+    }
+    if (!stats || stats.ino !== writer.ino) {
+      releaseJsonlWriter(filePath);
+      writer = null;
+    } else {
+      // Pick up appends made by other processes
+      writer.size = stats.size;
+      writer.checkedAt = now;
+    }
+  }
+
+  if (writer) {
+    // Refresh LRU position
+    writers.delete(filePath);
+    writers.set(filePath, writer);
+    return writer;
+  }
+
+  if (writers.size >= MAX_OPEN_WRITERS) {
+    releaseJsonlWriter(writers.keys().next().value);
+  }
+
+  const fd = openSync(filePath, 'a');
+  const { ino, size } = fstatSync(fd);
+  writer = { fd, ino, size, checkedAt: now, dirty: false };
+  writers.set(filePath, writer);
+  return writer;
+}
+
+/**
+ * Close the cached append handle for a path, if any.
+ * Call after replacing the file (atomic rewrite, truncate) so the next
+ * append opens the new file instead of writing to the old inode.
+ */
+export function releaseJsonlWriter(filePath) {
+  const writer = writers.get(filePath);
+  if (!writer) return;
+  writers.delete(filePath);
+  if (writer.dirty) {
+    try {
+      fdatasyncSync(writer.fd);
+    } catch (err) {
+      console.error(`[JSONL Rotate] fsync failed: ${err.message}`);
+    }
+  }
+  try {
+    closeSync(writer.fd);
+  } catch {
+    // Already closed
+  }
+}
+
+/**
+ * fdatasync every handle written since the last group commit
+ */
+function syncDirtyWriters() {
+  for (const writer of writers.values()) {
+    if (!writer.dirty) continue;
+    writer.dirty = false;
+    try {
+      fdatasyncSync(writer.fd);
+    } catch (err) {
+      console.error(`[JSONL Rotate] fsync failed: ${err.message}`);
+    }
+  }
+}
+
+/**
+ * Close every cached append handle (shutdown / tests)
+ */
+export function closeJsonlWriters() {
+  for (const filePath of [...writers.keys()]) {
+    releaseJsonlWriter(filePath);
+  }
+  if (fsyncTimer) {
+    clearInterval(fsyncTimer);
+    fsyncTimer = null;
+  }
+}
+
+/**
+ * Append one record to a JSONL file through a cached handle, then rotate
+ * if needed. The directory must already exist (same as appendFileSync).
+ *
+ * @param {string} filePath - Path to the JSONL file
+ * @param {Object} record - Record to serialize as one line
+ * @param {Object} options - Rotation options, see rotateIfNeeded
+ * @param {boolean} options.sync - fdatasync before returning
+ */
+export function appendJsonlRecord(filePath, record, options = {}) {
+  writeRecords(filePath, JSON.stringify(record) + '\n', options);
+}
+
+/**
+ * Append a batch of records with a single write and one rotation check.
+ * Use when a burst of records is produced together (e.g. subtask creation).
+ *
+ * @param {string} filePath - Path to the JSONL file
+ * @param {Object[]} records - Records to serialize, one per line
+ * @param {Object} options - Rotation options, see rotateIfNeeded
+ * @param {boolean} options.sync - fdatasync before returning
+ */
+export function appendJsonlRecords(filePath, records, options = {}) {
+  if (records.length === 0) return;
+  writeRecords(filePath, serializeJsonl(records), options);
+}
+
+/**
+ * Serialize records as JSONL text, one line per record.
+ * Appending to a single string lets V8 build it as a rope and flatten it
+ * once on write — about a quarter faster on large batches than mapping to
+ * an array of lines and joining it.
+ */
+export function serializeJsonl(records) {
+  let text = '';
+  for (const record of records) {
+    text += JSON.stringify(record) + '\n';
+  }
+  return text;
+}
+
+/**
+ * Write serialized lines through the cached handle; only enter the rotation
+ * path once the tracked size reaches the limit
+ */
+function writeRecords(filePath, lines, options) {
+  const writer = getWriter(filePath);
+  writer.size += writeSync(writer.fd, lines);
+
+  if (options.sync) {
+    fdatasyncSync(writer.fd);
+    writer.dirty = false;
+  } else if (FSYNC_INTERVAL_MS > 0) {
+    writer.dirty = true;
+    if (!fsyncTimer) {
+      fsyncTimer = setInterval(syncDirtyWriters, FSYNC_INTERVAL_MS);
+      fsyncTimer.unref();
+    }
+  }
+
+  if (writer.size >= (options.maxBytes ?? DEFAULT_MAX_BYTES)) {
+    rotateIfNeeded(filePath, options);
+  }
+}
+
 /**
  * Check if a JSONL file needs rotation and rotate if so.
  * Call this after appending to a JSONL file.
@@ -23,8 +206,7 @@ export function rotateIfNeeded(filePath, options = {}) {
   const maxBytes = options.maxBytes ?? DEFAULT_MAX_BYTES;
   const maxRotations = options.maxRotations ?? DEFAULT_MAX_ROTATIONS;
 
-  if (!existsSync(filePath)) return false;
-
+  // One stat covers both the existence and the size check
   let size;
   try {
     size = statSync(filePath).size;
@@ -34,6 +216,9 @@ export function rotateIfNeeded(filePath, options = {}) {
 
   if (size < maxBytes) return false;
 
+  // The current file is about to be replaced; drop any cached handle to it
+  releaseJsonlWriter(filePath);
+
   // If keepLines is set, truncate the file to the last N lines
   if (options.keepLines) {
     return truncateToLastN(filePath, options.keepLines);
@@ -64,20 +249,23 @@ export function rotateIfNeeded(filePath, options = {}) {
 /**
  * Truncate a JSONL file to the last N lines.
  * More space-efficient than rotation for files where old data is rarely needed.
+ * Only the tail that is kept gets read, so truncating a large log does not
+ * pull the discarded head of the file through memory and the page cache.
  */
 export function truncateToLastN(filePath, keepLines) {
   if (!existsSync(filePath)) return false;
 
   try {
-    const content = readFileSync(filePath, 'utf-8').trim();
-    if (!content) return false;
+    // One extra line tells us whether anything would be dropped
+    const { text, starts } = tailLineBounds(filePath, keepLines + 1);
+    if (starts.length <= keepLines) return false;
 
-    const lines = content.split('\n');
-    if (lines.length <= keepLines) return false;
-
-    const kept = lines.slice(-keepLines);
-    atomicWriteFileSync(filePath, kept.join('\n') + '\n');
-    console.log(`[JSONL Rotate] Truncated ${filePath}: ${lines.length} -> ${kept.length} lines`);
+    // Keep everything from the oldest surviving line on as one slice
+    // instead of materializing and re-joining each kept line
+    const kept = text.slice(starts[starts.length - keepLines]);
+    releaseJsonlWriter(filePath);
+    atomicWriteFileSync(filePath, kept.endsWith('\n') ? kept : kept + '\n');
+    console.log(`[JSONL Rotate] Truncated ${filePath} to last ${keepLines} lines`);
     return true;
   } catch (err) {
     console.error(`[JSONL Rotate] Failed to truncate ${filePath}: ${err.message}`);
@@ -85,21 +273,141 @@ export function truncateToLastN(filePath, keepLines) {
   }
 }
 
+// Finds the first non-whitespace character at or after lastIndex
+const NON_SPACE_RE = /\S/g;
+
+function hasContent(text, start, end) {
+  NON_SPACE_RE.lastIndex = start;
+  const match = NON_SPACE_RE.exec(text);
+  return match !== null && match.index < end;
+}
+
+/**
+ * Locate the last N non-empty lines of a file without loading all of it.
+ * Scans backwards from the end in fixed-size blocks until enough newlines
+ * have been seen, so a multi-MB log costs roughly one block per call.
+ * Lines are returned as parallel start/end offsets into the decoded tail,
+ * oldest first, so callers only slice out the strings they need.
+ */
+function tailLineBounds(filePath, n) {
+  const fd = openSync(filePath, 'r');
+  try {
+    let pos = fstatSync(fd).size;
+    const blocks = [];
+    let newlines = 0;
+
+    // n complete lines need n+1 newlines when the region starts mid-file
+    while (pos > 0 && newlines <= n) {
+      const len = Math.min(TAIL_BLOCK_BYTES, pos);
+      pos -= len;
+      const block = Buffer.allocUnsafe(len);
+      readSync(fd, block, 0, len, pos);
+      for (let i = block.indexOf(10); i !== -1; i = block.indexOf(10, i + 1)) {
+        newlines++;
+      }
+      blocks.push(block);
+    }
+
+    // A region that starts mid-file begins with a partial line; decode from
+    // the first complete line on, straight out of the read buffer
+    const region = blocks.length === 1 ? blocks[0] : Buffer.concat(blocks.reverse());
+    const firstByte = pos === 0 ? 0 : region.indexOf(10) + 1;
+    const text = region.toString('utf-8', firstByte);
+
+    // Walk the decoded text backwards line by line, recording offsets only
+    const starts = [];
+    const ends = [];
+    let end = text.length;
+    while (starts.length < n) {
+      const nl = end > 0 ? text.lastIndexOf('\n', end - 1) : -1;
+      if (nl === -1) {
+        if (hasContent(text, 0, end)) {
+          starts.push(0);
+          ends.push(end);
+        }
+        break;
+      }
+      if (hasContent(text, nl + 1, end)) {
+        starts.push(nl + 1);
+        ends.push(end);
+      }
+      end = nl;
+    }
+    return { text, starts: starts.reverse(), ends: ends.reverse() };
+  } finally {
+    closeSync(fd);
+  }
+}
+
+/**
+ * Read the last N non-empty lines of a file as strings, oldest first.
+ */
+function tailLines(filePath, n) {
+  const { text, starts, ends } = tailLineBounds(filePath, n);
+  const lines = new Array(starts.length);
+  for (let i = 0; i < starts.length; i++) {
+    lines[i] = text.slice(starts[i], ends[i]);
+  }
+  return lines;
+}
+
+/**
+ * Read a whole JSONL file, skipping blank and malformed lines.
+ *
+ * @param {string} filePath
+ * @returns {Array} Parsed records ([] if the file is missing or empty)
+ */
+export function readJsonl(filePath) {
+  let content;
+  try {
+    content = readFileSync(filePath, 'utf-8').trim();
+  } catch (err) {
+    if (err.code === 'ENOENT') return [];
+    throw err;
+  }
+  if (!content) return [];
+  const lines = content.split('\n');
+
+  // Fast path: one JSON.parse over the whole file as an array is ~10-15%
+  // quicker than a parse per line. Any blank or malformed line makes it
+  // throw (or changes the element count), and we fall back to per-line
+  // parsing so bad records are skipped individually.
+  try {
+    const records = JSON.parse(`[${lines.join(',')}]`);
+    if (records.length === lines.length) return records.filter(Boolean);
+  } catch {
+    // Fall through
+  }
+
+  return lines.map(line => {
+    try {
+      return JSON.parse(line);
+    } catch {
+      return null;
+    }
+  }).filter(Boolean);
+}
+
 /**
  * Read only the last N lines from a JSONL file, parsed as JSON.
  * Much more efficient than reading the entire file for recent-only queries.
+ *
+ * @param {string} filePath
+ * @param {number} [n=10] - Number of trailing lines to consider
+ * @param {Object} [options]
+ * @param {string} [options.includes] - Only parse lines containing this raw
+ *   substring (e.g. '"type":"reflection"'); other lines are skipped before
+ *   JSON.parse. Callers still check the parsed field — this is a prefilter.
  */
-export function readLastN(filePath, n = 10) {
-  if (!existsSync(filePath)) return [];
+export function readLastN(filePath, n = 10, options = {}) {
+  if (n <= 0) return [];
+  const { includes } = options;
 
   try {
-    const content = readFileSync(filePath, 'utf-8').trim();
-    if (!content) return [];
-
-    const lines = content.split('\n');
-    const lastLines = lines.slice(-n);
+    let lines = tailLines(filePath, n);
+    if (includes) lines = lines.filter(line => line.includes(includes));
 
-    return lastLines.map(line => {
+    return lines.map(line => {
       try {
         return JSON.parse(line);
       } catch {
@@ -107,8 +415,19 @@ export function readLastN(filePath, n = 10) {
       }
     }).filter(Boolean);
   } catch {
+    // Missing or unreadable file
     return [];
   }
 }
 
-export default { rotateIfNeeded, truncateToLastN, readLastN };
+export default {
+  rotateIfNeeded,
+  truncateToLastN,
+  readJsonl,
+  readLastN,
+  appendJsonlRecord,
+  appendJsonlRecords,
+  serializeJsonl,
+  releaseJsonlWriter,
+  closeJsonlWriters,
+};
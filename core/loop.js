@@ -14,7 +14,6 @@ import {
   buildCompletionNotification,
   isAutonomousTask,
 } from './autonomous-feedback.js';
-import { checkDigestDue } from './self-improvement.js';
 
 // Event emitter for UI notifications
 const listeners = new Map();
@@ -81,7 +80,7 @@ async function tick() {
     await checkApprovals();
 
     // 1.5. Check if self-improvement digest is due
-    checkSelfImprovementDigest();
+    await checkSelfImprovementDigest();
 
     // 2. Check triggers (time-based, condition-based)
     await checkTriggers();
@@ -98,9 +97,12 @@ async function tick() {
 }
 
 // Check if self-improvement digest is due
-function checkSelfImprovementDigest() {
+// Imported on first use: self-improvement pulls in the ACE scorer and
+// precedent memory, which a loop with the feature disabled never needs.
+async function checkSelfImprovementDigest() {
   if (!config.selfImprovement?.enabled) return;
   try {
+    const { checkDigestDue } = await import('./self-improvement.js');
     const { due, digest } = checkDigestDue();
     if (due && digest) {
       emit('self-improvement:digest', { digest });
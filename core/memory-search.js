@@ -97,7 +97,8 @@ function saveIndex() {
     idx.lastUpdated = new Date().toISOString();
     idx.stats.totalTerms = Object.keys(idx.terms).length;
 
-    atomicWriteFileSync(INDEX_PATH, JSON.stringify(idx, null, 2));
+    // Compact JSON: the index is machine-read only and can hold many terms
+    atomicWriteFileSync(INDEX_PATH, JSON.stringify(idx));
     indexDirty = false;
     console.log(`[MemorySearch] Saved index (${idx.stats.totalDocs} docs, ${idx.stats.totalTerms} terms)`);
   } catch (err) {
@@ -135,7 +136,8 @@ export function indexEntry(entry, source) {
   const docId = entry.id || generateDocId(source, entry.lineNum || Date.now());
 
   // Skip if already indexed (unless content changed)
-  if (idx.documents[docId] && idx.documents[docId].indexed === entry.ts) {
+  const previous = idx.documents[docId];
+  if (previous && previous.indexed === entry.ts) {
     return false;
   }
 
@@ -171,8 +173,12 @@ export function indexEntry(entry, source) {
       idx.terms[term] = [];
     }
 
-    // Remove old entry if exists
-    idx.terms[term] = idx.terms[term].filter(e => e.docId !== docId);
+    // Remove old entry if exists. Postings only hold documents that are in
+    // idx.documents, so a new document (every one, during a rebuild) can
+    // skip scanning the term's whole posting list.
+    if (previous) {
+      idx.terms[term] = idx.terms[term].filter(e => e.docId !== docId);
+    }
 
     // Add new entry
     idx.terms[term].push({
@@ -308,6 +314,15 @@ function parseQuery(queryString) {
   return query;
 }
 
+/**
+ * Lowercased preview and title of a document, for phrase matching.
+ * A single template literal: phrase-only queries call this for every
+ * document, so no per-document array is built just to be joined.
+ */
+function searchableText(doc) {
+  return `${doc.preview || ''} ${doc.title || ''}`.toLowerCase();
+}
+
 /**
  * Search the index
  *
@@ -330,34 +345,33 @@ export function search(queryString, options = {}) {
 
   // Process MUST terms (AND)
   if (query.must.length > 0) {
-    // Find documents that contain ALL must terms
-    const mustDocs = new Set();
-    let first = true;
-
-    for (const term of query.must) {
-      const termDocs = new Set((idx.terms[term] || []).map(e => e.docId));
-
-      if (first) {
-        termDocs.forEach(d => mustDocs.add(d));
-        first = false;
-      } else {
-        // Intersection
-        for (const doc of mustDocs) {
-          if (!termDocs.has(doc)) {
-            mustDocs.delete(doc);
-          }
+    // Postings per term as docId -> score, built once per query so the
+    // intersection and scoring below are map lookups, not list scans
+    const postings = query.must.map(term => {
+      const byDoc = new Map();
+      for (const entry of (idx.terms[term] || [])) {
+        if (!byDoc.has(entry.docId)) {
+          byDoc.set(entry.docId, entry.score);
         }
       }
-    }
+      return byDoc;
+    });
 
-    // Score matching documents
-    for (const docId of mustDocs) {
-      scores[docId] = 0;
-      for (const term of query.must) {
-        const termEntry = (idx.terms[term] || []).find(e => e.docId === docId);
-        if (termEntry) {
-          scores[docId] += termEntry.score;
+    // Keep documents that contain ALL must terms, summing their term scores
+    const [firstTerm, ...otherTerms] = postings;
+    for (const [docId, score] of firstTerm) {
+      let total = score;
+      let matchesAll = true;
+      for (const byDoc of otherTerms) {
+        const termScore = byDoc.get(docId);
+        if (termScore === undefined) {
+          matchesAll = false;
+          break;
         }
+        total += termScore;
+      }
+      if (matchesAll) {
+        scores[docId] = total;
       }
     }
   }
@@ -385,10 +399,7 @@ export function search(queryString, options = {}) {
       if (!doc) continue;
 
       // Check both title and preview for phrase matches
-      const searchableContent = [
-        doc.preview || '',
-        doc.title || '',
-      ].join(' ').toLowerCase();
+      const searchableContent = searchableText(doc);
 
       for (const phrase of query.phrases) {
         if (!searchableContent.includes(phrase)) {
@@ -405,10 +416,7 @@ export function search(queryString, options = {}) {
     for (const [docId, doc] of Object.entries(idx.documents)) {
       if (scores[docId] !== undefined) continue; // Already scored
 
-      const searchableContent = [
-        doc.preview || '',
-        doc.title || '',
-      ].join(' ').toLowerCase();
+      const searchableContent = searchableText(doc);
 
       let allPhrasesMatch = true;
       for (const phrase of query.phrases) {
@@ -1,45 +1,113 @@
 // Memory system - JSONL-based storage for conversations, tasks, goals, learnings
-import { readFileSync, appendFileSync, existsSync, readdirSync } from 'fs';
+import { readFileSync, existsSync, readdirSync, statSync } from 'fs';
 import { join } from 'path';
 import { config } from '../config.js';
 import { atomicWriteFileSync } from './atomic-write.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
-
-// Generic JSONL operations
-function readJsonl(filePath) {
-  if (!existsSync(filePath)) return [];
-  const content = readFileSync(filePath, 'utf-8').trim();
-  if (!content) return [];
-  return content.split('\n').map(line => {
-    try {
-      return JSON.parse(line);
-    } catch {
-      return null;
-    }
-  }).filter(Boolean);
+import {
+  appendJsonlRecord, appendJsonlRecords, releaseJsonlWriter, readJsonl, readLastN, serializeJsonl,
+} from './jsonl-rotate.js';
+
+// Task status changes are appended to the index as { id, status } deltas
+// instead of rewriting the whole file; readIndex folds later records for an
+// id over earlier ones, keeping first-seen order. Once superseded records
+// outnumber live entries (and there are at least INDEX_COMPACT_MIN of them)
+// the writer that appended the delta rewrites the index in compacted form;
+// reads never modify the file.
+const INDEX_COMPACT_MIN = 64;
+// Indexes are not logs — rotating one away would lose entries
+const INDEX_APPEND_OPTIONS = { maxBytes: Infinity };
+
+function foldIndex(records) {
+  const byId = new Map();
+  for (const record of records) {
+    const prev = byId.get(record.id);
+    byId.set(record.id, prev ? { ...prev, ...record } : record);
+  }
+  return [...byId.values()];
+}
+
+// Parsed JSONL files (task/goal indexes, approvals, learnings), keyed by path
+// and validated against inode, size and mtime. The loop re-reads indexes every
+// tick and every prompt build scans learnings; an unchanged file now costs one
+// stat instead of a read and parse. Appends change the size and atomic
+// rewrites or rotation change the inode, so either invalidates the entry.
+// Returned arrays are shared — callers must not mutate.
+const jsonlCache = new Map();
+
+function readJsonlCached(filePath, { fold = false } = {}) {
+  let stats;
+  try {
+    stats = statSync(filePath, { bigint: true });
+  } catch {
+    jsonlCache.delete(filePath);
+    return [];
+  }
+
+  const cached = jsonlCache.get(filePath);
+  if (cached && cached.ino === stats.ino && cached.size === stats.size &&
+      cached.mtimeNs === stats.mtimeNs) {
+    return cached.entries;
+  }
+
+  const records = readJsonl(filePath);
+  const entries = fold ? foldIndex(records) : records;
+  jsonlCache.set(filePath, {
+    ino: stats.ino, size: stats.size, mtimeNs: stats.mtimeNs, entries,
+    superseded: records.length - entries.length,
+  });
+  return entries;
+}
+
+function readIndex(filePath) {
+  return readJsonlCached(filePath, { fold: true });
 }
 
 function appendJsonl(filePath, record) {
-  appendFileSync(filePath, JSON.stringify(record) + '\n');
-  rotateIfNeeded(filePath);
+  appendJsonlRecord(filePath, record);
+}
+
+function appendIndex(filePath, record) {
+  appendJsonlRecord(filePath, record, INDEX_APPEND_OPTIONS);
 }
 
 function writeJsonl(filePath, records) {
-  atomicWriteFileSync(filePath, records.map(r => JSON.stringify(r)).join('\n') + '\n');
+  atomicWriteFileSync(filePath, serializeJsonl(records));
+  releaseJsonlWriter(filePath);
 }
 
+// Called after appending a status delta. The fold lands in the read cache,
+// so the next readIndex of an unchanged file is still a single stat.
+function compactIndexIfNeeded(filePath) {
+  const entries = readIndex(filePath);
+  const { superseded } = jsonlCache.get(filePath);
+  if (superseded < Math.max(INDEX_COMPACT_MIN, entries.length)) return;
+
+  writeJsonl(filePath, entries);
+  const stats = statSync(filePath, { bigint: true });
+  jsonlCache.set(filePath, { ino: stats.ino, size: stats.size, mtimeNs: stats.mtimeNs, entries, superseded: 0 });
+}
+
+// Open directly and treat ENOENT as missing rather than probing with
+// existsSync first — one syscall round trip per task/goal lookup
 function readJson(filePath) {
-  if (!existsSync(filePath)) return null;
-  return JSON.parse(readFileSync(filePath, 'utf-8'));
+  let content;
+  try {
+    content = readFileSync(filePath, 'utf-8');
+  } catch (err) {
+    if (err.code === 'ENOENT') return null;
+    throw err;
+  }
+  return JSON.parse(content);
 }
 
 function writeJson(filePath, data) {
   atomicWriteFileSync(filePath, JSON.stringify(data, null, 2));
 }
 
-// ID generation
-function generateId(prefix = '') {
-  const ts = Date.now().toString(36);
+// ID generation. Creators pass the same `now` they stamp the record with,
+// so each record costs one clock read.
+function generateId(prefix = '', now = Date.now()) {
+  const ts = now.toString(36);
   const rand = Math.random().toString(36).slice(2, 6);
   return prefix ? `${prefix}-${ts}-${rand}` : `${ts}-${rand}`;
 }
@@ -51,14 +119,17 @@ export const conversations = {
   },
 
   get(userId, limit = 50) {
-    const messages = readJsonl(this.getPath(userId));
-    return limit ? messages.slice(-limit) : messages;
+    // With a limit, read only the file's tail rather than decoding and
+    // parsing the whole history to keep the last few messages
+    if (limit) return readLastN(this.getPath(userId), limit);
+    return readJsonl(this.getPath(userId));
   },
 
   append(userId, message) {
+    const now = Date.now();
     const record = {
-      id: generateId('msg'),
-      ts: new Date().toISOString(),
+      id: generateId('msg', now),
+      ts: new Date(now).toISOString(),
       ...message,
     };
     appendJsonl(this.getPath(userId), record);
@@ -67,7 +138,10 @@ export const conversations = {
 
   clear(userId) {
     const path = this.getPath(userId);
-    if (existsSync(path)) atomicWriteFileSync(path, '');
+    if (existsSync(path)) {
+      atomicWriteFileSync(path, '');
+      releaseJsonlWriter(path);
+    }
   },
 };
 
@@ -82,20 +156,39 @@ export const tasks = {
   },
 
   create(task) {
-    const record = {
-      id: generateId('task'),
+    const record = this.build(task);
+    writeJson(this.getPath(record.id), record);
+    appendIndex(this.listPath(), { id: record.id, status: record.status, description: record.description });
+    return record;
+  },
+
+  // Create several tasks at once; the index gets a single batched append
+  createMany(taskList) {
+    // One timestamp for the whole batch
+    const now = Date.now();
+    const records = taskList.map(task => this.build(task, now));
+    for (const record of records) {
+      writeJson(this.getPath(record.id), record);
+    }
+    appendJsonlRecords(this.listPath(), records.map(record => (
+      { id: record.id, status: record.status, description: record.description }
+    )), INDEX_APPEND_OPTIONS);
+    return records;
+  },
+
+  build(task, now = Date.now()) {
+    const ts = new Date(now).toISOString();
+    return {
+      id: generateId('task', now),
       status: 'pending',
       origin: 'user',
       requires_approval: false,
-      created: new Date().toISOString(),
-      updated: new Date().toISOString(),
+      created: ts,
+      updated: ts,
       attempts: [],
       artifacts: [],
       ...task,
     };
-    writeJson(this.getPath(record.id), record);
-    appendJsonl(this.listPath(), { id: record.id, status: record.status, description: record.description });
-    return record;
   },
 
   get(taskId) {
@@ -107,22 +200,25 @@ export const tasks = {
   update(taskId, updates) {
     const task = this.get(taskId);
     if (!task) throw new Error(`Task not found: ${taskId}`);
+    return this.applyUpdates(task, updates);
+  },
+
+  // Write updates over a task record the caller has already loaded, so
+  // read-modify-write helpers don't read the same file a second time
+  applyUpdates(task, updates) {
     const updated = { ...task, ...updates, updated: new Date().toISOString() };
-    writeJson(this.getPath(taskId), updated);
+    writeJson(this.getPath(task.id), updated);
 
-    // Also update the index if status changed
+    // Also record the status change in the index (appended, folded on read)
     if (updates.status) {
-      const index = readJsonl(this.listPath());
-      const newIndex = index.map(entry =>
-        entry.id === taskId ? { ...entry, status: updates.status } : entry
-      );
-      writeJsonl(this.listPath(), newIndex);
+      appendIndex(this.listPath(), { id: task.id, status: updates.status });
+      compactIndexIfNeeded(this.listPath());
     }
     return updated;
   },
 
   list(filter = {}) {
-    const index = readJsonl(this.listPath());
+    const index = readIndex(this.listPath());
     return index.filter(entry => {
       if (filter.status && entry.status !== filter.status) return false;
       return true;
@@ -136,11 +232,12 @@ export const tasks = {
 
   addAttempt(taskId, attempt) {
     const task = this.get(taskId);
+    if (!task) throw new Error(`Task not found: ${taskId}`);
     task.attempts.push({
       ts: new Date().toISOString(),
       ...attempt,
     });
-    return this.update(taskId, { attempts: task.attempts });
+    return this.applyUpdates(task, { attempts: task.attempts });
   },
 };
 
@@ -155,19 +252,21 @@ export const goals = {
   },
 
   create(goal) {
+    const now = Date.now();
+    const ts = new Date(now).toISOString();
     const record = {
-      id: generateId('goal'),
+      id: generateId('goal', now),
       status: 'proposed',
       origin: 'user',
       priority: 'medium',
-      created: new Date().toISOString(),
-      updated: new Date().toISOString(),
+      created: ts,
+      updated: ts,
       tasks: [],
       context: {},
       ...goal,
     };
     writeJson(this.getPath(record.id), record);
-    appendJsonl(this.listPath(), { id: record.id, status: record.status, description: record.description });
+    appendIndex(this.listPath(), { id: record.id, status: record.status, description: record.description });
     return record;
   },
 
@@ -178,13 +277,18 @@ export const goals = {
   update(goalId, updates) {
     const goal = this.get(goalId);
     if (!goal) throw new Error(`Goal not found: ${goalId}`);
+    return this.applyUpdates(goal, updates);
+  },
+
+  // Write updates over an already-loaded goal record (see tasks.applyUpdates)
+  applyUpdates(goal, updates) {
     const updated = { ...goal, ...updates, updated: new Date().toISOString() };
-    writeJson(this.getPath(goalId), updated);
+    writeJson(this.getPath(goal.id), updated);
     return updated;
   },
 
   list(filter = {}) {
-    const index = readJsonl(this.listPath());
+    const index = readIndex(this.listPath());
     return index.filter(entry => {
       if (filter.status && entry.status !== filter.status) return false;
       return true;
@@ -199,7 +303,7 @@ export const goals = {
     const goal = this.get(goalId);
     if (!goal.tasks.includes(taskId)) {
       goal.tasks.push(taskId);
-      return this.update(goalId, { tasks: goal.tasks });
+      return this.applyUpdates(goal, { tasks: goal.tasks });
     }
     return goal;
   },
@@ -212,9 +316,10 @@ export const learnings = {
   },
 
   add(learning) {
+    const now = Date.now();
     const record = {
-      id: generateId('learn'),
-      ts: new Date().toISOString(),
+      id: generateId('learn', now),
+      ts: new Date(now).toISOString(),
       confidence: 0.5,
       ...learning,
     };
@@ -223,7 +328,7 @@ export const learnings = {
   },
 
   find(tags = [], minConfidence = 0) {
-    const all = readJsonl(this.path());
+    const all = readJsonlCached(this.path());
     return all.filter(l => {
       if (l.confidence < minConfidence) return false;
       if (tags.length === 0) return true;
@@ -232,8 +337,9 @@ export const learnings = {
     });
   },
 
+  // Copied so callers can't mutate the shared read cache
   all() {
-    return readJsonl(this.path());
+    return readJsonlCached(this.path()).slice();
   },
 };
 
@@ -244,10 +350,11 @@ export const approvals = {
   },
 
   request(approval) {
+    const now = Date.now();
     const record = {
-      id: generateId('approval'),
+      id: generateId('approval', now),
       status: 'pending',
-      requested: new Date().toISOString(),
+      requested: new Date(now).toISOString(),
       ...approval,
     };
     appendJsonl(this.path(), record);
@@ -255,13 +362,13 @@ export const approvals = {
   },
 
   pending() {
-    return readJsonl(this.path()).filter(a => a.status === 'pending');
+    return readIndex(this.path()).filter(a => a.status === 'pending');
   },
 
   // Note: read-modify-write is safe here because all ops are synchronous.
   // If this ever becomes async, use withLock from ./file-lock.js
   resolve(approvalId, decision, resolvedBy) {
-    const all = readJsonl(this.path());
+    const all = readIndex(this.path());
     const updated = all.map(a => {
       if (a.id === approvalId) {
         return { ...a, status: decision, resolvedBy, resolvedAt: new Date().toISOString() };
@@ -81,19 +81,16 @@ export async function planTask(task) {
   if (analysis.action === 'decompose' && analysis.subtasks?.length > 0) {
     console.log(`[Planner] Decomposing into ${analysis.subtasks.length} subtasks`);
 
-    const createdSubtasks = [];
-    for (const st of analysis.subtasks) {
-      const desc = typeof st === 'string' ? st : st.description;
-      const subtask = tasks.create({
-        description: desc,
-        priority: st.priority || task.priority || 'medium',
-        parent_task_id: task.id,
-        origin: 'planner',
-        analyzed: true, // Subtasks are pre-analyzed (they're already specific)
-        tags: task.tags || [],
-      });
-      createdSubtasks.push(subtask);
-      console.log(`[Planner] Created subtask: ${subtask.id} - ${desc.slice(0, 50)}...`);
+    const createdSubtasks = tasks.createMany(analysis.subtasks.map(st => ({
+      description: typeof st === 'string' ? st : st.description,
+      priority: st.priority || task.priority || 'medium',
+      parent_task_id: task.id,
+      origin: 'planner',
+      analyzed: true, // Subtasks are pre-analyzed (they're already specific)
+      tags: task.tags || [],
+    })));
+    for (const subtask of createdSubtasks) {
+      console.log(`[Planner] Created subtask: ${subtask.id} - ${subtask.description.slice(0, 50)}...`);
     }
 
     // Mark original task as decomposed
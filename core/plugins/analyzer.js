@@ -93,29 +93,38 @@ export const RISK_LEVELS = {
   CRITICAL: 'critical',
 };
 
+// Flattened pattern list with each pattern's source string computed once
+const PATTERN_LIST = Object.entries(PATTERNS).flatMap(([category, patterns]) =>
+  patterns.map(pattern => ({ category, pattern, label: pattern.toString() })));
+
 /**
- * Analyze a single file
+ * Analyze a single file.
+ * Each pattern is first tested against the whole content; only patterns that
+ * match somewhere get the per-line scan that locates them. Most plugins trip
+ * few patterns, so most of the line loops are skipped. The whole-content test
+ * can only over-approximate (\s may cross a newline), never miss a line match.
  */
 function analyzeFile(filePath, content) {
   const findings = [];
-  const lines = content.split('\n');
-
-  for (const [category, patterns] of Object.entries(PATTERNS)) {
-    for (const pattern of patterns) {
-      for (let i = 0; i < lines.length; i++) {
-        const line = lines[i];
-        const match = line.match(pattern);
-
-        if (match) {
-          findings.push({
-            category,
-            pattern: pattern.toString(),
-            match: match[0],
-            file: filePath,
-            line: i + 1,
-            context: line.trim().slice(0, 100),
-          });
-        }
+  let lines = null;
+
+  for (const { category, pattern, label } of PATTERN_LIST) {
+    if (!pattern.test(content)) continue;
+    lines ??= content.split('\n');
+
+    for (let i = 0; i < lines.length; i++) {
+      const line = lines[i];
+      const match = line.match(pattern);
+
+      if (match) {
+        findings.push({
+          category,
+          pattern: label,
+          match: match[0],
+          file: filePath,
+          line: i + 1,
+          context: line.trim().slice(0, 100),
+        });
       }
     }
   }
@@ -123,36 +132,83 @@ function analyzeFile(filePath, content) {
   return findings;
 }
 
+// Findings per source file, keyed by absolute path and validated against the
+// file's size and nanosecond mtime. Re-analysing an unchanged plugin (update
+// checks, repeated approval views) then skips the pattern scan entirely.
+const findingsCache = new Map();
+const MAX_FINDINGS_CACHE = 500;
+
 /**
- * Collect all JavaScript files from a directory
+ * Read and analyze a file, reusing cached findings when it is unchanged on
+ * disk. The file is stat'd before it is read, so a write racing the read can
+ * only make the cache entry look stale, never hide new content.
+ *
+ * @param {string} filePath - Absolute path, used for reading and as cache key
+ * @param {string} displayPath - Path recorded in findings
+ * @returns {{ content: string, findings: Object[] }}
  */
-function collectJsFiles(dir, files = []) {
-  const entries = readdirSync(dir, { withFileTypes: true });
+function analyzeFileCached(filePath, displayPath) {
+  const { mtimeNs, size } = statSync(filePath, { bigint: true });
+  const content = readFileSync(filePath, 'utf-8');
+
+  const cached = findingsCache.get(filePath);
+  if (cached && cached.mtimeNs === mtimeNs && cached.size === size &&
+      cached.displayPath === displayPath) {
+    return { content, findings: cached.findings };
+  }
+
+  const findings = analyzeFile(displayPath, content);
+  findingsCache.delete(filePath);
+  if (findingsCache.size >= MAX_FINDINGS_CACHE) {
+    findingsCache.delete(findingsCache.keys().next().value);
+  }
+  findingsCache.set(filePath, { mtimeNs, size, displayPath, findings });
+  return { content, findings };
+}
 
-  for (const entry of entries) {
-    const fullPath = join(dir, entry.name);
+// Extensions treated as plugin source
+const JS_EXTENSIONS = new Set(['.js', '.mjs', '.cjs', '.ts']);
+
+/**
+ * Collect all JavaScript files from a directory.
+ * One readdir per directory; dirent types come back with the listing, so
+ * nothing is stat'd and paths are only joined for entries that are kept.
+ * Sorted once at the end so the content hash does not depend on readdir order.
+ */
+function collectJsFiles(dir) {
+  const files = [];
+  walkJsFiles(dir, files);
+  return files.sort();
+}
+
+function walkJsFiles(dir, files) {
+  for (const entry of readdirSync(dir, { withFileTypes: true })) {
+    const name = entry.name;
 
     if (entry.isDirectory()) {
       // Skip node_modules and hidden directories
-      if (entry.name !== 'node_modules' && !entry.name.startsWith('.')) {
-        collectJsFiles(fullPath, files);
-      }
-    } else if (entry.isFile()) {
-      const ext = extname(entry.name).toLowerCase();
-      if (['.js', '.mjs', '.cjs', '.ts'].includes(ext)) {
-        files.push(fullPath);
+      if (name !== 'node_modules' && !name.startsWith('.')) {
+        walkJsFiles(join(dir, name), files);
       }
+    } else if (entry.isFile() && JS_EXTENSIONS.has(extname(name).toLowerCase())) {
+      files.push(join(dir, name));
     }
   }
-
-  return files;
 }
 
 /**
- * Calculate content hash for tracking changes
+ * Calculate content hash for tracking changes.
+ * Takes the file contents as a list and feeds them to the hash one by one,
+ * which yields the same digest as hashing their concatenation without ever
+ * building the combined string.
+ * @param {string[]} contents
  */
-function calculateHash(content) {
-  return createHash('sha256').update(content).digest('hex').slice(0, 16);
+function calculateHash(contents) {
+  const hash = createHash('sha256');
+  for (const content of contents) {
+    hash.update(content);
+  }
+  return hash.digest('hex').slice(0, 16);
 }
 
 /**
@@ -240,21 +296,20 @@ function generateSummary(findings, riskLevel) {
  */
 export function analyzePlugin(pluginPath) {
   const allFindings = [];
-  let allContent = '';
+  const contents = [];
 
   try {
     const jsFiles = collectJsFiles(pluginPath);
 
     for (const filePath of jsFiles) {
-      const content = readFileSync(filePath, 'utf-8');
-      allContent += content;
-      const findings = analyzeFile(filePath.replace(pluginPath, ''), content);
+      const { content, findings } = analyzeFileCached(filePath, filePath.replace(pluginPath, ''));
+      contents.push(content);
       allFindings.push(...findings);
     }
 
     const riskLevel = determineRiskLevel(allFindings);
     const summary = generateSummary(allFindings, riskLevel);
-    const hash = calculateHash(allContent);
+    const hash = calculateHash(contents);
 
     return {
       success: true,
@@ -340,13 +395,7 @@ export function generateReport(analysis) {
 export function needsReanalysis(pluginPath, previousHash) {
   try {
     const jsFiles = collectJsFiles(pluginPath);
-    let allContent = '';
-
-    for (const filePath of jsFiles) {
-      allContent += readFileSync(filePath, 'utf-8');
-    }
-
-    const currentHash = calculateHash(allContent);
+    const currentHash = calculateHash(jsFiles.map(filePath => readFileSync(filePath, 'utf-8')));
     return currentHash !== previousHash;
 
   } catch (err) {
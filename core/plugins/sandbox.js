@@ -17,10 +17,32 @@ import { dirname } from 'path';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 
+// Call arguments and results cross the worker boundary as JSON text: one
+// stringify sanitizes them (functions, class instances dropped), and cloning
+// a string is a flat copy instead of a second deep structured clone.
+
+/**
+ * Serialize a call result for the worker boundary. A value JSON has no text
+ * for (a function or Symbol) throws, so the caller sends an error response
+ * instead of a payload the other side cannot parse.
+ */
+function toJsonText(value) {
+  const text = JSON.stringify(value ?? null);
+  if (text === undefined) throw new Error('Result is not JSON-serializable');
+  return text;
+}
+
 // Worker script that runs inside the isolated thread
 const WORKER_SCRIPT = `
 const { parentPort, workerData } = require('worker_threads');
 
+// Same contract as the host's toJsonText: no text means an error response
+function toJsonText(value) {
+  const text = JSON.stringify(value ?? null);
+  if (text === undefined) throw new Error('Result is not JSON-serializable');
+  return text;
+}
+
 // Block dangerous globals inside the worker
 delete globalThis.process.env;
 // Override require to prevent loading dangerous modules
@@ -57,8 +79,15 @@ const forgekeeperProxy = new Proxy({}, {
             const handler = (msg) => {
               if (msg.type === 'api_response' && msg.callId === callId) {
                 parentPort.off('message', handler);
-                if (msg.error) reject(new Error(msg.error));
-                else resolve(msg.result);
+                if (msg.error) {
+                  reject(new Error(msg.error));
+                  return;
+                }
+                try {
+                  resolve(JSON.parse(msg.result));
+                } catch (err) {
+                  reject(err);
+                }
               }
             };
             parentPort.on('message', handler);
@@ -67,7 +96,7 @@ const forgekeeperProxy = new Proxy({}, {
               callId,
               namespace: String(namespace),
               method: String(method),
-              args: JSON.parse(JSON.stringify(args)), // Structured clone safe
+              args: JSON.stringify(args), // JSON text: sanitized and cheap to clone
             });
           });
         };
@@ -116,8 +145,8 @@ try {
           parentPort.postMessage({ type: 'call_response', callId: msg.callId, error: 'Not a function: ' + msg.method });
           return;
         }
-        const result = await fn(...(msg.args || []));
-        parentPort.postMessage({ type: 'call_response', callId: msg.callId, result: JSON.parse(JSON.stringify(result ?? null)) });
+        const result = await fn(...(msg.args ? JSON.parse(msg.args) : []));
+        parentPort.postMessage({ type: 'call_response', callId: msg.callId, result: toJsonText(result) });
       } catch (err) {
         parentPort.postMessage({ type: 'call_response', callId: msg.callId, error: err.message });
       }
@@ -315,8 +344,15 @@ function callWorkerMethod(worker, method, args, timeout = 5000) {
       if (msg.type === 'call_response' && msg.callId === callId) {
         clearTimeout(timer);
         worker.off('message', handler);
-        if (msg.error) reject(new Error(msg.error));
-        else resolve(msg.result);
+        if (msg.error) {
+          reject(new Error(msg.error));
+          return;
+        }
+        try {
+          resolve(JSON.parse(msg.result));
+        } catch (err) {
+          reject(err);
+        }
       }
     };
 
@@ -325,7 +361,7 @@ function callWorkerMethod(worker, method, args, timeout = 5000) {
       type: 'call',
       callId,
       method,
-      args: JSON.parse(JSON.stringify(args ?? [])),
+      args: JSON.stringify(args ?? []),
     });
   });
 }
@@ -341,8 +377,8 @@ async function handleApiCall(pluginApi, msg, worker) {
       worker.postMessage({ type: 'api_response', callId, error: `Unknown API: ${namespace}.${method}` });
       return;
     }
-    const result = await ns[method](...args);
-    worker.postMessage({ type: 'api_response', callId, result: JSON.parse(JSON.stringify(result ?? null)) });
+    const result = await ns[method](...JSON.parse(args));
+    worker.postMessage({ type: 'api_response', callId, result: toJsonText(result) });
   } catch (err) {
     worker.postMessage({ type: 'api_response', callId, error: err.message });
   }
@@ -10,7 +10,7 @@ import { atomicWriteFileSync } from './atomic-write.js';
 import { join, dirname } from 'path';
 import { config } from '../config.js';
 import { query } from './claude.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { rotateIfNeeded, readLastN } from './jsonl-rotate.js';
 
 // Configuration
 const PERSONALITY_PATH = config.autonomous?.personalityPath || 'forgekeeper_personality';
@@ -49,6 +49,19 @@ function ensureDirectories() {
   }
 }
 
+// Topic extraction patterns — compiled once; extractTopics runs per thought
+const FILE_REF_PATTERN = /[\w\-./]+\.(js|ts|json|md|txt|py|jsx|tsx)/g;
+const CONCEPT_PATTERNS = [
+  /\b(uncommitted|commit|commits|push|pull|merge)\s*(files?|changes?)?/gi,
+  /\b(task|tasks|goal|goals)\s*(queue|list|pending)?/gi,
+  /\b(error|bug|issue|problem)\s*\w*/gi,
+  /\b(git|github|repository|repo)\b/gi,
+  /\b(test|testing|tests)\b/gi,
+  /\b(documentation|docs)\b/gi,
+  /\b(refactor|refactoring)\b/gi,
+  /\b(deploy|deployment)\b/gi,
+];
+
 /**
  * Extract key topics from text using simple keyword extraction
  */
@@ -59,22 +72,11 @@ function extractTopics(text) {
   const topics = new Set();
 
   // Extract file/path references
-  const fileMatches = words.match(/[\w\-./]+\.(js|ts|json|md|txt|py|jsx|tsx)/g) || [];
+  const fileMatches = words.match(FILE_REF_PATTERN) || [];
   fileMatches.forEach(f => topics.add(f));
 
   // Extract key nouns/concepts (simple heuristic)
-  const conceptPatterns = [
-    /\b(uncommitted|commit|commits|push|pull|merge)\s*(files?|changes?)?/gi,
-    /\b(task|tasks|goal|goals)\s*(queue|list|pending)?/gi,
-    /\b(error|bug|issue|problem)\s*\w*/gi,
-    /\b(git|github|repository|repo)\b/gi,
-    /\b(test|testing|tests)\b/gi,
-    /\b(documentation|docs)\b/gi,
-    /\b(refactor|refactoring)\b/gi,
-    /\b(deploy|deployment)\b/gi,
-  ];
-
-  for (const pattern of conceptPatterns) {
+  for (const pattern of CONCEPT_PATTERNS) {
     const matches = text.match(pattern) || [];
     matches.forEach(m => topics.add(m.toLowerCase().trim()));
   }
@@ -278,30 +280,7 @@ ${modification}`;
  * Get prompt evolution history
  */
 export function getEvolutionHistory(limit = 10) {
-  if (!existsSync(PROMPT_EVOLUTION_PATH)) {
-    return [];
-  }
-
-  try {
-    const lines = readFileSync(PROMPT_EVOLUTION_PATH, 'utf-8')
-      .trim()
-      .split('\n')
-      .filter(Boolean);
-
-    return lines
-      .slice(-limit)
-      .map(line => {
-        try {
-          return JSON.parse(line);
-        } catch {
-          return null;
-        }
-      })
-      .filter(Boolean)
-      .reverse();
-  } catch {
-    return [];
-  }
+  return readLastN(PROMPT_EVOLUTION_PATH, limit).reverse();
 }
 
 /**
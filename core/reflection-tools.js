@@ -5,12 +5,12 @@
  * These tools allow the reflection system to check actual state rather than speculating.
  */
 
-import { existsSync, readFileSync, appendFileSync, mkdirSync } from 'fs';
+import { existsSync, mkdirSync, openSync, readSync, closeSync } from 'fs';
 import { join } from 'path';
-import { execSync } from 'child_process';
+import { execFileSync } from 'child_process';
 import { config } from '../config.js';
 import { tasks } from './memory.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { appendJsonlRecord, readLastN } from './jsonl-rotate.js';
 
 // Configuration
 const PERSONALITY_PATH = config.autonomous?.personalityPath || 'forgekeeper_personality';
@@ -73,8 +73,7 @@ function logToolUsage(toolName, args, result) {
   };
 
   try {
-    appendFileSync(TOOL_USAGE_PATH, JSON.stringify(entry) + '\n');
-    rotateIfNeeded(TOOL_USAGE_PATH);
+    appendJsonlRecord(TOOL_USAGE_PATH, entry);
   } catch (err) {
     console.error('[ReflectionTools] Failed to log usage:', err.message);
   }
@@ -94,7 +93,8 @@ export function gitStatus() {
   if (!ENABLED) return null;
 
   try {
-    const status = execSync('git status --porcelain', {
+    // Run git directly rather than through a shell: one process per call
+    const status = execFileSync('git', ['status', '--porcelain'], {
       encoding: 'utf-8',
       timeout: 5000,
       stdio: ['pipe', 'pipe', 'pipe'],
@@ -102,10 +102,15 @@ export function gitStatus() {
 
     const lines = status.split('\n').filter(Boolean);
 
-    const modified = lines.filter(l => l.startsWith(' M') || l.startsWith('M ')).length;
-    const staged = lines.filter(l => l.startsWith('A ') || l.startsWith('M ')).length;
-    const untracked = lines.filter(l => l.startsWith('??')).length;
-    const deleted = lines.filter(l => l.startsWith(' D') || l.startsWith('D ')).length;
+    // Classify by the two-letter status code in a single pass
+    let modified = 0, staged = 0, untracked = 0, deleted = 0;
+    for (const line of lines) {
+      const code = line.slice(0, 2);
+      if (code === ' M' || code === 'M ') modified++;
+      if (code === 'A ' || code === 'M ') staged++;
+      if (code === '??') untracked++;
+      if (code === ' D' || code === 'D ') deleted++;
+    }
 
     const result = {
       modified,
@@ -190,6 +195,48 @@ export function checkFileExists(filePath) {
   }
 }
 
+// Block size for scanning files in readFileSnippet
+const SNIPPET_BLOCK_BYTES = 64 * 1024;
+
+/**
+ * Read the first maxLines lines of a file and count its total lines.
+ * Works on raw bytes in fixed-size blocks: only the head is kept and decoded,
+ * the rest of the file is scanned for newlines and discarded, so a large file
+ * is never held in memory or split into a line array.
+ */
+function readHeadLines(filePath, maxLines) {
+  const fd = openSync(filePath, 'r');
+  try {
+    const block = Buffer.allocUnsafe(SNIPPET_BLOCK_BYTES);
+    const head = [];
+    let newlines = 0;
+    let headDone = maxLines <= 0;
+    let bytesRead;
+
+    while ((bytesRead = readSync(fd, block, 0, SNIPPET_BLOCK_BYTES, null)) > 0) {
+      const chunk = block.subarray(0, bytesRead);
+      let i = chunk.indexOf(10);
+      while (i !== -1) {
+        newlines++;
+        if (!headDone && newlines === maxLines) {
+          // The head ends just before this newline
+          head.push(Buffer.from(chunk.subarray(0, i)));
+          headDone = true;
+        }
+        i = chunk.indexOf(10, i + 1);
+      }
+      if (!headDone) head.push(Buffer.from(chunk));
+    }
+
+    return {
+      head: Buffer.concat(head).toString('utf-8'),
+      totalLines: newlines + 1,
+    };
+  } finally {
+    closeSync(fd);
+  }
+}
+
 /**
  * Read the first N lines of a file
  */
@@ -215,15 +262,15 @@ export function readFileSnippet(filePath, maxLines = 50) {
       return result;
     }
 
-    const content = readFileSync(filePath, 'utf-8');
-    const lines = content.split('\n').slice(0, maxLines);
+    const { head, totalLines } = readHeadLines(filePath, maxLines);
+    const lineCount = Math.max(0, Math.min(maxLines, totalLines));
 
     const result = {
       path: filePath,
-      lineCount: lines.length,
-      totalLines: content.split('\n').length,
-      content: lines.join('\n'),
-      summary: `Read ${lines.length} lines from ${filePath}`,
+      lineCount,
+      totalLines,
+      content: head,
+      summary: `Read ${lineCount} lines from ${filePath}`,
     };
 
     logToolUsage('readFileSnippet', { filePath, maxLines }, result.summary);
@@ -314,28 +361,8 @@ You can check the current state of things rather than speculating. Use these to
  * Get recent tool usage
  */
 export function getRecentUsage(limit = 10) {
-  if (!existsSync(TOOL_USAGE_PATH)) return [];
-
-  try {
-    const lines = readFileSync(TOOL_USAGE_PATH, 'utf-8')
-      .trim()
-      .split('\n')
-      .filter(Boolean);
-
-    return lines
-      .slice(-limit)
-      .map(line => {
-        try {
-          return JSON.parse(line);
-        } catch {
-          return null;
-        }
-      })
-      .filter(Boolean)
-      .reverse();
-  } catch {
-    return [];
-  }
+  // Tail read: only the end of the log is touched, however long it grows
+  return readLastN(TOOL_USAGE_PATH, limit).reverse();
 }
 
 /**
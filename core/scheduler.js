@@ -36,19 +36,26 @@ const SKIP_APPROVAL = config.scheduler?.skipApproval ?? false;
 
 // In-memory state
 let scheduledTasks = [];
+let indexById = null; // task id -> position in scheduledTasks, built on first lookup
 let approvedTypes = new Set();
 const executionHistory = []; // Track recent executions for rate limiting
 const eventListeners = [];
 
+// Set once the directories exist so event logging and saves skip the stat
+// calls; cleared on a failed write so a removed directory gets recreated
+let directoriesReady = false;
+
 /**
  * Ensure directories exist
  */
 function ensureDirectories() {
+  if (directoriesReady) return;
   for (const dir of [DATA_DIR, JOURNAL_DIR, MEMORY_DIR]) {
     if (!existsSync(dir)) {
       mkdirSync(dir, { recursive: true });
     }
   }
+  directoriesReady = true;
 }
 
 /**
@@ -64,6 +71,7 @@ function logScheduledEvent(event) {
     }) + '\n');
     rotateIfNeeded(SCHEDULED_EVENTS_PATH);
   } catch (err) {
+    directoriesReady = false;
     console.error('[Scheduler] Failed to log event:', err.message);
   }
 }
@@ -89,14 +97,44 @@ function loadScheduledTasks() {
     if (existsSync(SCHEDULED_TASKS_PATH)) {
       const data = readFileSync(SCHEDULED_TASKS_PATH, 'utf-8');
       scheduledTasks = JSON.parse(data);
+      indexById = null;
       console.log(`[Scheduler] Loaded ${scheduledTasks.length} scheduled tasks`);
     }
   } catch (err) {
     console.error('[Scheduler] Failed to load tasks:', err.message);
     scheduledTasks = [];
+    indexById = null;
   }
 }
 
+/**
+ * Position of each task by id. Kept up to date by addScheduledTask and
+ * cancelTask; wholesale replacements of scheduledTasks reset it.
+ */
+function getIndexById() {
+  if (!indexById) {
+    indexById = new Map();
+    scheduledTasks.forEach((t, i) => indexById.set(t.id, i));
+  }
+  return indexById;
+}
+
+/**
+ * Find a scheduled task by id
+ */
+function findScheduledTask(taskId) {
+  const index = getIndexById().get(taskId);
+  return index === undefined ? undefined : scheduledTasks[index];
+}
+
+/**
+ * Add a task to the in-memory list
+ */
+function addScheduledTask(task) {
+  scheduledTasks.push(task);
+  indexById?.set(task.id, scheduledTasks.length - 1);
+}
+
 /**
  * Save scheduled tasks to disk
  */
@@ -106,6 +144,7 @@ function saveScheduledTasks() {
   try {
     atomicWriteFileSync(SCHEDULED_TASKS_PATH, JSON.stringify(scheduledTasks, null, 2));
   } catch (err) {
+    directoriesReady = false;
     console.error('[Scheduler] Failed to save tasks:', err.message);
   }
 }
@@ -139,6 +178,7 @@ function saveApprovedTypes() {
       updatedAt: new Date().toISOString(),
     }, null, 2));
   } catch (err) {
+    directoriesReady = false;
     console.error('[Scheduler] Failed to save approved types:', err.message);
   }
 }
@@ -172,19 +212,39 @@ function checkRateLimit() {
   };
 }
 
+// Statuses of tasks that can still run
+const LIVE_STATUSES = new Set(['pending', 'active']);
+
+// Field holding the next run time, per task type
+const DUE_FIELD_BY_TYPE = { oneshot: 'runAt', recurring: 'nextRun' };
+
+// Verbs that name a task type, in priority order, keyed to their rank
+const ACTION_VERB_RANK = new Map(
+  ['check', 'review', 'update', 'sync', 'clean', 'backup', 'report', 'notify', 'run']
+    .map((verb, rank) => [verb, rank])
+);
+
 /**
  * Extract task type for approval matching
  */
 function extractTaskType(task) {
   // Simple heuristic: first word or action verb
   const words = task.toLowerCase().split(/\s+/);
-  const actionVerbs = ['check', 'review', 'update', 'sync', 'clean', 'backup', 'report', 'notify', 'run'];
 
-  for (const verb of actionVerbs) {
-    if (words.includes(verb)) {
-      return verb;
+  // One pass over the words; the highest-priority verb present wins
+  let best = null;
+  let bestRank = Infinity;
+  for (const word of words) {
+    const rank = ACTION_VERB_RANK.get(word);
+    if (rank !== undefined && rank < bestRank) {
+      best = word;
+      bestRank = rank;
+      if (rank === 0) break;
     }
   }
+  if (best) {
+    return best;
+  }
 
   // Default to first two words
   return words.slice(0, 2).join('_');
@@ -394,9 +454,11 @@ export function scheduleTask(options) {
     runAtISO: new Date(runAt).toISOString(),
     createdAt: new Date().toISOString(),
     status: 'pending',
+    // Filled in on execution; declared up front so the record keeps one shape
+    completedAt: null,
   };
 
-  scheduledTasks.push(scheduledTask);
+  addScheduledTask(scheduledTask);
   saveScheduledTasks();
 
   logScheduledEvent({
@@ -507,9 +569,12 @@ export function scheduleRecurring(options) {
     createdAt: new Date().toISOString(),
     executionCount: 0,
     status: 'active',
+    // Filled in on execution; declared up front so the record keeps one shape
+    lastRun: null,
+    lastRunISO: null,
   };
 
-  scheduledTasks.push(scheduledTask);
+  addScheduledTask(scheduledTask);
   saveScheduledTasks();
 
   logScheduledEvent({
@@ -546,17 +611,22 @@ export function scheduleRecurring(options) {
  * @returns {Object} Cancellation result
  */
 export function cancelTask(taskId) {
-  const index = scheduledTasks.findIndex(t => t.id === taskId);
+  const index = getIndexById().get(taskId);
 
-  if (index === -1) {
+  if (index === undefined) {
     return {
       success: false,
       error: 'Task not found',
     };
   }
 
-  const task = scheduledTasks[index];
-  scheduledTasks.splice(index, 1);
+  // Splice keeps insertion order, which shows in the saved file and in
+  // getDueTasks; only the shifted tail needs its positions updated.
+  const [task] = scheduledTasks.splice(index, 1);
+  indexById.delete(taskId);
+  for (let i = index; i < scheduledTasks.length; i++) {
+    indexById.set(scheduledTasks[i].id, i);
+  }
   saveScheduledTasks();
 
   logScheduledEvent({
@@ -589,7 +659,7 @@ export function listScheduled() {
   const now = Date.now();
 
   return scheduledTasks
-    .filter(t => t.status === 'pending' || t.status === 'active')
+    .filter(t => LIVE_STATUSES.has(t.status))
     .map(t => ({
       id: t.id,
       type: t.type,
@@ -614,19 +684,12 @@ export function getDueTasks() {
   const now = Date.now();
 
   return scheduledTasks.filter(t => {
-    if (t.status !== 'pending' && t.status !== 'active') {
+    if (!LIVE_STATUSES.has(t.status)) {
       return false;
     }
 
-    if (t.type === 'oneshot') {
-      return t.runAt <= now;
-    }
-
-    if (t.type === 'recurring') {
-      return t.nextRun <= now;
-    }
-
-    return false;
+    const dueField = DUE_FIELD_BY_TYPE[t.type];
+    return dueField !== undefined && t[dueField] <= now;
   });
 }
 
@@ -647,7 +710,7 @@ export async function executeScheduled(taskId, executor) {
     };
   }
 
-  const task = scheduledTasks.find(t => t.id === taskId);
+  const task = findScheduledTask(taskId);
 
   if (!task) {
     return {
@@ -759,14 +822,20 @@ export function offSchedulerEvent(callback) {
 export function getStats() {
   const rateCheck = checkRateLimit();
 
+  // Tally every status in one pass instead of filtering once per status
+  const statusCounts = {};
+  for (const t of scheduledTasks) {
+    statusCounts[t.status] = (statusCounts[t.status] || 0) + 1;
+  }
+
   return {
     enabled: ENABLED,
     maxPerHour: MAX_PER_HOUR,
     rememberApproval: REMEMBER_APPROVAL,
     skipApproval: SKIP_APPROVAL,
-    pendingCount: scheduledTasks.filter(t => t.status === 'pending').length,
-    activeCount: scheduledTasks.filter(t => t.status === 'active').length,
-    completedCount: scheduledTasks.filter(t => t.status === 'completed').length,
+    pendingCount: statusCounts.pending || 0,
+    activeCount: statusCounts.active || 0,
+    completedCount: statusCounts.completed || 0,
     approvedTypesCount: approvedTypes.size,
     executionsThisHour: rateCheck.count,
     listenerCount: eventListeners.length,
@@ -790,6 +859,7 @@ export function cleanup(maxAge = 86400000) { // 24 hours
     }
     return true;
   });
+  indexById = null;
 
   if (cleaned > 0) {
     saveScheduledTasks();
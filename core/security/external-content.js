@@ -256,33 +256,33 @@ export function wrapExternalContent(content, options = {}) {
   // Sanitize content to prevent marker escaping
   const sanitized = sanitizeMarkers(content);
 
-  // Build metadata
+  // Build wrapped content in one flat list, joined once at the end
+  const parts = [];
+
+  if (includeWarning) {
+    parts.push(SECURITY_WARNING);
+    parts.push('');
+  }
+
+  parts.push(`${MARKERS.start} source="${source}"${sender ? ` sender="${sender}"` : ''}>>>`);
+
+  // Metadata
   const sourceLabel = SOURCE_LABELS[source] || SOURCE_LABELS.unknown;
-  const metadataLines = [`Source: ${sourceLabel}`];
+  parts.push(`Source: ${sourceLabel}`);
 
   if (sender) {
-    metadataLines.push(`From: ${sender}`);
+    parts.push(`From: ${sender}`);
   }
   if (senderId) {
-    metadataLines.push(`Sender ID: ${senderId}`);
+    parts.push(`Sender ID: ${senderId}`);
   }
   if (subject) {
-    metadataLines.push(`Subject: ${subject}`);
+    parts.push(`Subject: ${subject}`);
   }
   if (detectedPatterns.length > 0) {
-    metadataLines.push(`Warning: ${detectedPatterns.length} suspicious pattern(s) detected`);
+    parts.push(`Warning: ${detectedPatterns.length} suspicious pattern(s) detected`);
   }
 
-  // Build wrapped content
-  const parts = [];
-
-  if (includeWarning) {
-    parts.push(SECURITY_WARNING);
-    parts.push('');
-  }
-
-  parts.push(`${MARKERS.start} source="${source}"${sender ? ` sender="${sender}"` : ''}>>>`);
-  parts.push(metadataLines.join('\n'));
   parts.push('---');
   parts.push(sanitized);
   parts.push(MARKERS.end);
@@ -10,16 +10,17 @@
  */
 
 import { readFileSync, existsSync, unlinkSync } from 'fs';
-import { join, dirname } from 'path';
+import { join, dirname, extname, relative, isAbsolute } from 'path';
 import { config } from '../config.js';
 import { scoreAction, TIERS } from './ace/scorer.js';
 import { recordAction, recordOutcome } from './ace/precedent-memory.js';
 import { approvals } from './memory.js';
-import { atomicWriteFileSync } from './atomic-write.js';
-import { safeAppendFileSync } from './atomic-write.js';
+import { atomicWriteFileSync, safeAppendFileSync } from './atomic-write.js';
 import { rotateIfNeeded, readLastN } from './jsonl-rotate.js';
+import { readRef } from './git-refs.js';
 import { query } from './claude.js';
-import { spawn } from 'child_process';
+import { spawn, execFileSync } from 'child_process';
+import { createHash } from 'crypto';
 
 // Paths
 const PERSONALITY_PATH = config.autonomous?.personalityPath || 'forgekeeper_personality';
@@ -34,6 +35,28 @@ const TYPE_TO_ACTION_CLASS = {
   core: 'self:improve:core',
 };
 
+// Parsed argv per test command string — the gate runs the same command
+// repeatedly, so tokenize it once instead of on every run
+const testCommandArgv = new Map();
+
+// Test arguments containing these are globs for the runner, not file paths
+const GLOB_CHARS_RE = /[*?[{]/;
+
+// Changes to files with these extensions can affect test results; anything
+// else (reflection notes, markdown skills) skips the test gate
+const TESTED_EXTENSIONS = new Set(['.js', '.mjs', '.cjs', '.json']);
+
+// Passing gate results keyed by HEAD + working-tree state + test command +
+// change contents, so an identical change set re-validated against identical
+// code doesn't re-run tests. Building the key costs two git subprocesses
+// (diff + untracked listing) per gate run, far less than a test run.
+const passedGateCache = new Map();
+const PASSED_GATE_CACHE_MAX = 50;
+
+// Passing test runs keep only a head/tail excerpt of output above this size
+const TEST_OUTPUT_KEEP_BYTES = 64 * 1024;
+const TEST_OUTPUT_EXCERPT_BYTES = 4 * 1024;
+
 // In-memory tripwire state
 let tripwireState = {
   appliedThisHour: 0,
@@ -76,11 +99,73 @@ function getConfig() {
     maxPerDay: si.maxPerDay || 10,
     pauseOnConsecutiveFailures: si.pauseOnConsecutiveFailures || 3,
     testCommand: si.testCommand || 'node tests/run-all.js',
+    testParallel: si.testParallel || false,
     testTimeoutMs: si.testTimeoutMs || 60000,
     digestIntervalDays: si.digestIntervalDays || 7,
   };
 }
 
+/**
+ * Tokenize a test command into argv lists, memoized per command string.
+ * Suites may be chained with '&&'; each becomes its own argv and exact
+ * duplicates are dropped. When the suites are declared independent
+ * (parallel), plain `node --test <paths>` suites are also merged into one
+ * invocation since the node test runner already runs its files in parallel.
+ * @param {string} command - e.g. 'node tests/run-all.js && node --test tests/unit'
+ * @param {boolean} [parallel] - Whether the suites may run side by side
+ * @returns {string[][]} one argv (runner followed by its arguments) per suite
+ */
+function compileTestCommand(command, parallel = false) {
+  const cacheKey = `${parallel ? 'parallel' : 'sequential'}\0${command}`;
+  let argvs = testCommandArgv.get(cacheKey);
+  if (argvs) return argvs;
+
+  argvs = [];
+  const seen = new Set();
+  let nodeTest = null;
+  for (const part of command.split('&&')) {
+    const trimmed = part.trim();
+    if (!trimmed) continue;
+    const argv = trimmed.split(/\s+/);
+    const key = argv.join(' ');
+    if (seen.has(key)) continue;
+    seen.add(key);
+
+    const paths = argv.slice(2);
+    if (parallel && argv[0] === 'node' && argv[1] === '--test' && paths.length > 0 && paths.every(p => !p.startsWith('-'))) {
+      if (nodeTest) {
+        nodeTest.push(...paths.filter(p => !nodeTest.includes(p)));
+        continue;
+      }
+      nodeTest = argv;
+    }
+    argvs.push(argv);
+  }
+
+  testCommandArgv.set(cacheKey, argvs);
+  return argvs;
+}
+
+/**
+ * Decode collected test-runner output. Failures keep everything (the output
+ * is surfaced in the journal and events); passing runs with large output are
+ * reduced to a head/tail excerpt so the full buffer is never decoded.
+ * @param {Buffer[]} chunks - Raw stdout/stderr chunks in arrival order
+ * @param {number} totalBytes - Sum of chunk lengths
+ * @param {boolean} passed
+ * @returns {string}
+ */
+function decodeTestOutput(chunks, totalBytes, passed) {
+  const buf = Buffer.concat(chunks, totalBytes);
+  if (!passed || totalBytes <= TEST_OUTPUT_KEEP_BYTES) {
+    return buf.toString('utf-8');
+  }
+  const head = buf.subarray(0, TEST_OUTPUT_EXCERPT_BYTES).toString('utf-8');
+  const tail = buf.subarray(totalBytes - TEST_OUTPUT_EXCERPT_BYTES).toString('utf-8');
+  const omitted = totalBytes - 2 * TEST_OUTPUT_EXCERPT_BYTES;
+  return `${head}\n[... ${omitted} bytes omitted ...]\n${tail}`;
+}
+
 // ===== LAYER 1: CLASSIFICATION =====
 
 /**
@@ -159,9 +244,12 @@ export function snapshotState(changes) {
 /**
  * Rollback files to snapshot state
  * @param {Map<string, string|null>} snapshot
+ * @param {string[]} [files] - Only restore these paths (default: every snapshotted file)
  */
-export function rollback(snapshot) {
-  for (const [filePath, content] of snapshot) {
+export function rollback(snapshot, files = [...snapshot.keys()]) {
+  for (const filePath of files) {
+    if (!snapshot.has(filePath)) continue;
+    const content = snapshot.get(filePath);
     try {
       if (content === null) {
         // File didn't exist before — remove it
@@ -178,50 +266,72 @@ export function rollback(snapshot) {
 }
 
 /**
- * Apply proposed file changes
+ * Apply proposed file changes, skipping files whose content is already
+ * byte-identical (no rewrite, no mtime bump for file watchers)
  * @param {Array<{file: string, content: string}>} changes
+ * @param {Map<string, string|null>} [snapshot] - Current contents, if already read
+ * @returns {string[]} Paths of the files actually written
  */
-function applyChanges(changes) {
+function applyChanges(changes, snapshot = snapshotState(changes)) {
+  const written = [];
   for (const change of changes) {
+    if (snapshot.get(change.file) === change.content) continue;
     atomicWriteFileSync(change.file, change.content);
+    written.push(change.file);
   }
+  return written;
 }
 
 /**
- * Run the test gate — spawn test runner and check exit code
+ * Spawn a single test suite under the current node binary
+ * @param {string[]} argv - Runner name followed by its arguments
+ * @param {number} timeoutMs
  * @returns {Promise<{passed: boolean, output: string}>}
  */
-export function runTestGate() {
-  const cfg = getConfig();
-  const parts = cfg.testCommand.split(' ');
-  const cmd = parts[0];
-  const args = parts.slice(1);
+function runTestCommand(argv, timeoutMs) {
+  // argv[0] is the runner name; the gate always runs under the current node binary
+  const args = argv.slice(1);
+
+  // Cheap pre-check: a missing script can only fail with "Cannot find module",
+  // so fail the suite without paying for a node startup. This must fail
+  // closed — a gate that never ran any tests has not passed. Glob patterns
+  // are left to the runner (node --test expands them), since no shell does.
+  const missing = args.filter(arg => !arg.startsWith('-') && /\.[cm]?js$/.test(arg) &&
+    !GLOB_CHARS_RE.test(arg) && !existsSync(arg));
+  if (missing.length > 0) {
+    console.warn(`[SelfImprovement] Test script(s) not found: ${missing.join(', ')} — failing suite`);
+    return Promise.resolve({ passed: false, output: `Test script(s) not found: ${missing.join(', ')}` });
+  }
 
   return new Promise((resolve) => {
-    let output = '';
+    const chunks = [];
+    let totalBytes = 0;
     let timedOut = false;
 
     const child = spawn(process.execPath, args, {
       cwd: process.cwd(),
       stdio: ['ignore', 'pipe', 'pipe'],
       shell: false,
-      timeout: cfg.testTimeoutMs,
+      timeout: timeoutMs,
     });
 
-    child.stdout.on('data', (data) => { output += data.toString(); });
-    child.stderr.on('data', (data) => { output += data.toString(); });
+    // Keep raw bytes; decoding happens once when the run finishes
+    const collect = (data) => { chunks.push(data); totalBytes += data.length; };
+    child.stdout.on('data', collect);
+    child.stderr.on('data', collect);
 
     const timer = setTimeout(() => {
       timedOut = true;
       child.kill('SIGTERM');
-    }, cfg.testTimeoutMs);
+    }, timeoutMs);
 
     child.on('close', (code) => {
       clearTimeout(timer);
       if (timedOut) {
-        resolve({ passed: false, output: output + '\n[TIMEOUT]' });
+        resolve({ passed: false, output: decodeTestOutput(chunks, totalBytes, false) + '\n[TIMEOUT]' });
       } else {
-        resolve({ passed: code === 0, output });
+        const passed = code === 0;
+        resolve({ passed, output: decodeTestOutput(chunks, totalBytes, passed) });
       }
     });
 
@@ -232,6 +342,127 @@ export function runTestGate() {
   });
 }
 
+/**
+ * Directories holding runtime state rather than code. They change on every
+ * loop tick and message, so hashing them would make the gate key unique per
+ * run; they are pruned from the untracked-file walk.
+ */
+function runtimeStateExcludes() {
+  const excludes = [':(exclude)node_modules'];
+  for (const dir of [config.paths?.data || './data', PERSONALITY_PATH]) {
+    const rel = relative(process.cwd(), dir);
+    if (rel && !rel.startsWith('..') && !isAbsolute(rel)) {
+      excludes.push(`:(exclude)${rel}`);
+    }
+  }
+  return excludes;
+}
+
+/**
+ * Digest of uncommitted code: tracked edits as a binary diff against HEAD plus
+ * untracked files the tests can load (TESTED_EXTENSIONS) outside node_modules
+ * and the data/personality state directories. Earlier uncommitted
+ * improvements change the code under test, so they must be part of the gate
+ * cache key. Spawns git twice.
+ * @returns {string|null} hex digest, or null if git is unavailable
+ */
+function workingTreeDigest() {
+  try {
+    const git = (args) => execFileSync('git', args, {
+      cwd: process.cwd(),
+      stdio: ['ignore', 'pipe', 'ignore'],
+      maxBuffer: 64 * 1024 * 1024,
+    });
+
+    const hash = createHash('sha256').update(git(['diff', 'HEAD', '--binary']));
+    const untracked = git(['ls-files', '--others', '--exclude-standard', '-z', '--', '.', ...runtimeStateExcludes()])
+      .toString('utf-8')
+      .split('\0')
+      .filter(file => file && TESTED_EXTENSIONS.has(extname(file)));
+    for (const file of untracked) {
+      hash.update('\0').update(file).update('\0');
+      try {
+        hash.update(readFileSync(file));
+      } catch {
+        // Removed since listing; the name alone still marks the state
+      }
+    }
+    return hash.digest('hex');
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Cache key for a gate run over a change set, or null if the HEAD or
+ * working-tree state is unknown (no caching then)
+ */
+function gateCacheKey(command, changes) {
+  const head = readRef('HEAD');
+  if (!head) return null;
+  const tree = workingTreeDigest();
+  if (!tree) return null;
+
+  const hash = createHash('sha256').update(head).update('\0').update(tree).update('\0').update(command);
+  for (const change of changes) {
+    hash.update('\0').update(change.file).update('\0').update(change.content ?? '');
+  }
+  return hash.digest('hex');
+}
+
+/**
+ * Run the test gate — spawn the test suite(s) and check exit codes.
+ * Chained suites run in order and stop at the first failure, or concurrently
+ * when testParallel is set; the gate passes only if all pass.
+ * @param {Array<{file: string}>} [changes] - When given, the gate is skipped
+ *   if none of the changed files can affect the tests
+ * @returns {Promise<{passed: boolean, output: string, skipped?: boolean, cached?: boolean}>}
+ */
+export async function runTestGate(changes) {
+  if (changes && !changes.some(c => TESTED_EXTENSIONS.has(extname(c.file)))) {
+    return { passed: true, output: 'skipped: no code changes', skipped: true };
+  }
+
+  const cfg = getConfig();
+  const cacheKey = changes ? gateCacheKey(cfg.testCommand, changes) : null;
+  if (cacheKey && passedGateCache.has(cacheKey)) {
+    return { passed: true, output: 'cached: identical change set passed against identical code', cached: true };
+  }
+
+  const argvs = compileTestCommand(cfg.testCommand, cfg.testParallel);
+  let result;
+  if (argvs.length === 1) {
+    result = await runTestCommand(argvs[0], cfg.testTimeoutMs);
+  } else {
+    let results;
+    if (cfg.testParallel) {
+      results = await Promise.all(argvs.map(argv => runTestCommand(argv, cfg.testTimeoutMs)));
+    } else {
+      // '&&' semantics: one suite at a time, later suites only after a pass
+      results = [];
+      for (const argv of argvs) {
+        const suiteResult = await runTestCommand(argv, cfg.testTimeoutMs);
+        results.push(suiteResult);
+        if (!suiteResult.passed) break;
+      }
+    }
+    result = {
+      passed: results.length === argvs.length && results.every(r => r.passed),
+      output: results.map((r, i) => `$ ${argvs[i].join(' ')}\n${r.output}`).join('\n'),
+    };
+  }
+
+  // Only real passes are cached — failures may be flaky and should re-run,
+  // and a skipped suite proved nothing about the code
+  if (cacheKey && result.passed && !result.skipped) {
+    if (passedGateCache.size >= PASSED_GATE_CACHE_MAX) {
+      passedGateCache.delete(passedGateCache.keys().next().value);
+    }
+    passedGateCache.set(cacheKey, Date.now());
+  }
+  return result;
+}
+
 /**
  * Self-review a diff using Claude
  * @param {Object} improvement
@@ -314,14 +545,16 @@ async function validateAndApply(improvement, tier) {
   if (tier === TIERS.DELIBERATE) {
     const snapshot = snapshotState(improvement.changes);
 
-    applyChanges(improvement.changes);
+    // Only files that were actually written need restoring on rollback;
+    // unchanged ones were compared in memory against the snapshot
+    const written = applyChanges(improvement.changes, snapshot);
 
     // Run tests
-    const testResult = await runTestGate();
+    const testResult = await runTestGate(improvement.changes);
 
     if (!testResult.passed) {
       // Rollback
-      rollback(snapshot);
+      rollback(snapshot, written);
       tripwireState.consecutiveFailures++;
 
       // Check if we should pause
@@ -353,7 +586,7 @@ async function validateAndApply(improvement, tier) {
 
     if (!review.approved) {
       // Rollback on self-review rejection
-      rollback(snapshot);
+      rollback(snapshot, written);
       tripwireState.consecutiveFailures++;
 
       recordToJournal({
@@ -490,9 +723,13 @@ export async function processImprovement(improvement) {
  */
 export function generateDigest(days = 7) {
   const entries = readLastN(JOURNAL_PATH, 200);
-  const cutoff = Date.now() - (days * 24 * 60 * 60 * 1000);
+  const now = Date.now();
+  const cutoff = now - (days * 24 * 60 * 60 * 1000);
+  // Journal timestamps are UTC ISO strings (recordToJournal), which sort
+  // lexically — compare strings instead of parsing a Date per entry
+  const cutoffIso = new Date(cutoff).toISOString();
 
-  const recent = entries.filter(e => e.ts && new Date(e.ts).getTime() >= cutoff);
+  const recent = entries.filter(e => e.ts && e.ts >= cutoffIso);
 
   const byOutcome = { applied: 0, rolled_back: 0, review_rejected: 0, awaiting_approval: 0, rate_limited: 0 };
   const byType = {};
@@ -507,7 +744,7 @@ export function generateDigest(days = 7) {
   }
 
   return {
-    period: { days, from: new Date(cutoff).toISOString(), to: new Date().toISOString() },
+    period: { days, from: cutoffIso, to: new Date(now).toISOString() },
     total: recent.length,
     byOutcome,
     byType,
@@ -627,6 +864,7 @@ export function resetState() {
     dayResetAt: Date.now() + 86400000,
     lastDigestAt: null,
   };
+  passedGateCache.clear();
 }
 
 /**
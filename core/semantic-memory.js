@@ -10,6 +10,7 @@
 
 import { existsSync, readFileSync, mkdirSync } from 'fs';
 import { atomicWriteFileSync } from './atomic-write.js';
+import { readJsonl } from './jsonl-rotate.js';
 import { join } from 'path';
 import { config } from '../config.js';
 
@@ -23,6 +24,9 @@ const ENABLED = config.semanticMemory?.enabled ?? false;
 const TOP_K = config.semanticMemory?.topK ?? 3;
 const MODEL_NAME = config.semanticMemory?.model || 'Xenova/all-MiniLM-L6-v2';
 
+// Texts per model call when embedding in bulk (journal rebuild)
+const EMBED_BATCH_SIZE = 16;
+
 // Module state
 let pipeline = null;
 let embedder = null;
@@ -33,6 +37,21 @@ let initError = null;
 let embeddingsCache = null;
 let cacheLoaded = false;
 
+// Recent search rankings keyed by topK and query text. Entries are only ever
+// appended to a store (a rebuild swaps in a new object), so the store plus
+// its entry count identifies what a ranking was computed against. When only
+// the store has changed, the cached query vector still saves the model call.
+const searchCache = new Map();
+const MAX_SEARCH_CACHE = 64;
+
+// Ids of the entries in the current store, so store() can detect duplicates
+// without scanning every entry. Entries are append-only, so the set is valid
+// while it belongs to the same store object and covers the same number of
+// entries; otherwise it is rebuilt from the entries.
+let entryIds = null;
+let entryIdsStore = null;
+let entryIdsCount = 0;
+
 /**
  * Load transformers.js dynamically (optional dependency)
  */
@@ -142,7 +161,8 @@ function saveEmbeddings() {
     }
 
     embeddingsCache.lastUpdated = new Date().toISOString();
-    atomicWriteFileSync(EMBEDDINGS_PATH, JSON.stringify(embeddingsCache, null, 2));
+    // Compact JSON: pretty-printing puts every vector component on its own line
+    atomicWriteFileSync(EMBEDDINGS_PATH, JSON.stringify(embeddingsCache));
   } catch (err) {
     console.error('[SemanticMemory] Failed to save embeddings:', err.message);
   }
@@ -171,6 +191,57 @@ export async function embed(text) {
   }
 }
 
+/**
+ * Generate embeddings for several texts in one model call.
+ * The pipeline runs the whole batch as a single tensor, so per-call overhead
+ * is paid once and the ONNX runtime can spread the work across its threads.
+ *
+ * @param {string[]} texts - Texts to embed
+ * @returns {Promise<Array<number[]>|null>} One vector per text, or null if unavailable
+ */
+export async function embedBatch(texts) {
+  if (!isAvailable() || texts.length === 0) {
+    return null;
+  }
+
+  try {
+    const output = await embedder(texts, { pooling: 'mean', normalize: true });
+    const dim = output.dims[output.dims.length - 1];
+    return texts.map((_, i) => Array.from(output.data.subarray(i * dim, (i + 1) * dim)));
+  } catch (err) {
+    console.error('[SemanticMemory] Batch embedding failed:', err.message);
+    return null;
+  }
+}
+
+/**
+ * Set of entry ids in the given store, rebuilt only when entries were added
+ * outside store() or the store was replaced
+ */
+function getEntryIds(store) {
+  if (entryIdsStore !== store || entryIdsCount !== store.entries.length) {
+    entryIds = new Set(store.entries.map(e => e.id));
+    entryIdsStore = store;
+    entryIdsCount = store.entries.length;
+  }
+  return entryIds;
+}
+
+/**
+ * Build a stored entry from text, metadata and its vector
+ */
+function createEntry(text, metadata, vector) {
+  return {
+    id: metadata.id || `emb-${Date.now()}`,
+    text: text.slice(0, 500), // Store preview
+    vector,
+    ts: metadata.ts || new Date().toISOString(),
+    type: metadata.type || 'unknown',
+    source: metadata.source || null,
+    journalEntry: metadata.journalEntry || null,
+  };
+}
+
 /**
  * Store text with its embedding
  *
@@ -186,12 +257,9 @@ export async function store(text, metadata = {}) {
   const store = loadEmbeddings();
 
   // Check if already stored (by ID)
-  if (metadata.id) {
-    const existing = store.entries.findIndex(e => e.id === metadata.id);
-    if (existing >= 0) {
-      // Already stored, skip
-      return true;
-    }
+  if (metadata.id && getEntryIds(store).has(metadata.id)) {
+    // Already stored, skip
+    return true;
   }
 
   // Generate embedding
@@ -200,18 +268,11 @@ export async function store(text, metadata = {}) {
     return false;
   }
 
-  // Create entry
-  const entry = {
-    id: metadata.id || `emb-${Date.now()}`,
-    text: text.slice(0, 500), // Store preview
-    vector,
-    ts: metadata.ts || new Date().toISOString(),
-    type: metadata.type || 'unknown',
-    source: metadata.source || null,
-    journalEntry: metadata.journalEntry || null,
-  };
-
+  const entry = createEntry(text, metadata, vector);
+  const ids = getEntryIds(store);
   store.entries.push(entry);
+  ids.add(entry.id);
+  entryIdsCount = store.entries.length;
 
   // Save periodically (every 10 entries)
   if (store.entries.length % 10 === 0) {
@@ -257,22 +318,44 @@ export async function search(query, topK = TOP_K) {
     return [];
   }
 
+  const cacheKey = `${topK}\0${query}`;
+  const cached = searchCache.get(cacheKey);
+  if (cached) {
+    // Refresh recency
+    searchCache.delete(cacheKey);
+    searchCache.set(cacheKey, cached);
+    if (cached.store === store && cached.size === store.entries.length) {
+      return cached.results.slice();
+    }
+  }
+
   // Embed the query
-  const queryVector = await embed(query);
+  const queryVector = cached?.vector ?? await embed(query);
   if (!queryVector) {
     return [];
   }
 
-  // Calculate similarities
+  // Calculate similarities; entries are only copied once they make the top K
   const scored = store.entries.map(entry => ({
-    ...entry,
+    entry,
     score: cosineSimilarity(queryVector, entry.vector),
   }));
 
   // Sort by similarity and return top K
   scored.sort((a, b) => b.score - a.score);
 
-  return scored.slice(0, topK).map(({ vector, ...rest }) => rest);
+  const results = scored.slice(0, topK).map(({ entry, score }) => {
+    const { vector, ...rest } = entry;
+    return { ...rest, score };
+  });
+
+  searchCache.delete(cacheKey);
+  if (searchCache.size >= MAX_SEARCH_CACHE) {
+    searchCache.delete(searchCache.keys().next().value);
+  }
+  searchCache.set(cacheKey, { store, size: store.entries.length, vector: queryVector, results });
+
+  return results.slice();
 }
 
 /**
@@ -374,41 +457,47 @@ export async function rebuildFromJournal() {
 
   // Clear existing
   embeddingsCache = createEmptyStore();
+  cacheLoaded = true;
 
   // Load journal files
   const journalDir = join(PERSONALITY_PATH, 'journal');
   const journalFiles = ['thoughts.jsonl', 'shared.jsonl'];
 
-  let indexed = 0;
+  // Collect embeddable entries first, then embed them in batches
+  const pending = [];
+  const seenIds = new Set();
   for (const file of journalFiles) {
     const path = join(journalDir, file);
-    if (!existsSync(path)) continue;
-
-    const lines = readFileSync(path, 'utf-8').trim().split('\n');
-    for (const line of lines) {
-      try {
-        const entry = JSON.parse(line);
-        const text = entry.thought || entry.content;
-        if (text && text.length >= 20) {
-          await store(text, {
-            id: entry.id || `${file}:${entry.ts}`,
-            type: entry.type,
-            ts: entry.ts,
-            source: path,
-          });
-          indexed++;
-
-          // Progress logging
-          if (indexed % 50 === 0) {
-            console.log(`[SemanticMemory] Indexed ${indexed} entries...`);
-          }
-        }
-      } catch {
-        // Skip invalid lines
+
+    // readJsonl parses the whole journal in one call when every line is
+    // valid, and skips invalid lines otherwise
+    for (const entry of readJsonl(path)) {
+      const text = entry.thought || entry.content;
+      const id = entry.id || `${file}:${entry.ts}`;
+      if (text && text.length >= 20 && !seenIds.has(id)) {
+        seenIds.add(id);
+        pending.push({ text, metadata: { id, type: entry.type, ts: entry.ts, source: path } });
       }
     }
   }
 
+  let indexed = 0;
+  for (let i = 0; i < pending.length; i += EMBED_BATCH_SIZE) {
+    const batch = pending.slice(i, i + EMBED_BATCH_SIZE);
+    const vectors = await embedBatch(batch.map(item => item.text));
+    if (!vectors) continue;
+
+    batch.forEach((item, j) => {
+      embeddingsCache.entries.push(createEntry(item.text, item.metadata, vectors[j]));
+    });
+    indexed += batch.length;
+
+    // Progress logging
+    if (Math.floor(indexed / 50) > Math.floor((indexed - batch.length) / 50)) {
+      console.log(`[SemanticMemory] Indexed ${indexed} entries...`);
+    }
+  }
+
   saveEmbeddings();
   console.log(`[SemanticMemory] Rebuilt complete: ${indexed} entries indexed`);
 
@@ -426,6 +515,7 @@ export default {
   initSemanticMemory,
   isAvailable,
   embed,
+  embedBatch,
   store,
   search,
   getRelevantContext,
@@ -13,9 +13,9 @@
  *     ...
  */
 
-import { existsSync, mkdirSync, readFileSync, appendFileSync, readdirSync, unlinkSync, rmdirSync, statSync } from 'fs';
+import { mkdirSync, readFileSync, appendFileSync, readdirSync, rmSync, statSync } from 'fs';
 import { atomicWriteFileSync } from './atomic-write.js';
-import { rotateIfNeeded } from './jsonl-rotate.js';
+import { rotateIfNeeded, readJsonl } from './jsonl-rotate.js';
 import { join, dirname } from 'path';
 import { config } from '../config.js';
 
@@ -67,13 +67,30 @@ class LRUCache {
 // Session chunk cache
 const chunkCache = new LRUCache(CACHE_SIZE);
 
+// Disk usage per session directory, keyed on the directory's mtime. Every
+// message append rewrites metadata.json via rename, which bumps the directory
+// mtime, so an unchanged mtime means the file sizes haven't changed either.
+const diskSizeCache = new Map();
+
+// Directories this process has already created or found. mkdir runs once per
+// directory rather than an existsSync probe (plus mkdir) on every append;
+// pruning forgets the directories it removes.
+const knownDirs = new Set();
+
+/**
+ * Ensure a directory exists, hitting the filesystem only the first time
+ */
+function ensureDir(dir) {
+  if (knownDirs.has(dir)) return;
+  mkdirSync(dir, { recursive: true });
+  knownDirs.add(dir);
+}
+
 /**
  * Ensure sessions directory exists
  */
 function ensureSessionsDir() {
-  if (!existsSync(SESSIONS_DIR)) {
-    mkdirSync(SESSIONS_DIR, { recursive: true });
-  }
+  ensureDir(SESSIONS_DIR);
 }
 
 /**
@@ -104,32 +121,22 @@ function getSummaryPath(sessionId) {
   return join(getSessionDir(sessionId), 'summary.json');
 }
 
-/**
- * Read JSONL file
- */
-function readJsonl(filePath) {
-  if (!existsSync(filePath)) return [];
-  const content = readFileSync(filePath, 'utf-8').trim();
-  if (!content) return [];
-  return content.split('\n').map(line => {
-    try {
-      return JSON.parse(line);
-    } catch {
-      return null;
-    }
-  }).filter(Boolean);
-}
-
 /**
  * Append to JSONL file
  */
 function appendJsonl(filePath, record) {
-  ensureSessionsDir();
   const dir = dirname(filePath);
-  if (!existsSync(dir)) {
-    mkdirSync(dir, { recursive: true });
+  const line = JSON.stringify(record) + '\n';
+  ensureDir(dir);
+  try {
+    appendFileSync(filePath, line);
+  } catch (err) {
+    if (err.code !== 'ENOENT') throw err;
+    // Directory was removed from outside this process; recreate it
+    knownDirs.delete(dir);
+    ensureDir(dir);
+    appendFileSync(filePath, line);
   }
-  appendFileSync(filePath, JSON.stringify(record) + '\n');
   rotateIfNeeded(filePath);
 }
 
@@ -137,11 +144,7 @@ function appendJsonl(filePath, record) {
  * Create or update session metadata
  */
 export function updateMetadata(sessionId, updates = {}) {
-  ensureSessionsDir();
-  const sessionDir = getSessionDir(sessionId);
-  if (!existsSync(sessionDir)) {
-    mkdirSync(sessionDir, { recursive: true });
-  }
+  ensureDir(getSessionDir(sessionId));
 
   const metadataPath = getMetadataPath(sessionId);
   let metadata = {
@@ -152,16 +155,23 @@ export function updateMetadata(sessionId, updates = {}) {
     totalTokensEstimate: 0,
   };
 
-  if (existsSync(metadataPath)) {
-    try {
-      metadata = JSON.parse(readFileSync(metadataPath, 'utf-8'));
-    } catch {
-      // Use defaults
-    }
+  // A missing file lands in the catch, so no separate existence check
+  try {
+    metadata = JSON.parse(readFileSync(metadataPath, 'utf-8'));
+  } catch {
+    // Use defaults
   }
 
-  metadata = { ...metadata, ...updates, lastUpdated: new Date().toISOString() };
-  atomicWriteFileSync(metadataPath, JSON.stringify(metadata, null, 2));
+  return writeMetadata(sessionId, metadata, updates);
+}
+
+/**
+ * Apply updates to already-loaded metadata and write it out
+ */
+function writeMetadata(sessionId, current, updates) {
+  const metadata = { ...current, ...updates, lastUpdated: new Date().toISOString() };
+  // Written once per appended message; compact output keeps that write small
+  atomicWriteFileSync(getMetadataPath(sessionId), JSON.stringify(metadata));
   return metadata;
 }
 
@@ -170,9 +180,6 @@ export function updateMetadata(sessionId, updates = {}) {
  */
 export function getMetadata(sessionId) {
   const metadataPath = getMetadataPath(sessionId);
-  if (!existsSync(metadataPath)) {
-    return null;
-  }
   try {
     return JSON.parse(readFileSync(metadataPath, 'utf-8'));
   } catch {
@@ -199,11 +206,11 @@ export function appendMessage(sessionId, message) {
   // Append to chunk
   appendJsonl(chunkPath, record);
 
-  // Update metadata
+  // Update metadata (from the copy loaded above rather than re-reading it)
   const newChunkCount = chunkIndex + 1;
   const tokenEstimate = (message.content?.length || 0) / 4; // Rough estimate
 
-  updateMetadata(sessionId, {
+  writeMetadata(sessionId, metadata, {
     messageCount: metadata.messageCount + 1,
     chunkCount: Math.max(metadata.chunkCount || 0, newChunkCount),
     totalTokensEstimate: (metadata.totalTokensEstimate || 0) + tokenEstimate,
@@ -241,7 +248,13 @@ export function loadChunk(sessionId, chunkIndex) {
  * Get recent messages (for quick context)
  */
 export function getRecentMessages(sessionId, count = SUMMARY_MESSAGES) {
-  const metadata = getMetadata(sessionId);
+  return recentMessagesFor(sessionId, getMetadata(sessionId), count);
+}
+
+/**
+ * Recent messages for a session whose metadata is already loaded
+ */
+function recentMessagesFor(sessionId, metadata, count) {
   if (!metadata || metadata.messageCount === 0) {
     return [];
   }
@@ -271,15 +284,13 @@ export function getSessionContext(sessionId) {
 
   const summaryPath = getSummaryPath(sessionId);
   let summary = null;
-  if (existsSync(summaryPath)) {
-    try {
-      summary = JSON.parse(readFileSync(summaryPath, 'utf-8'));
-    } catch {
-      summary = null;
-    }
+  try {
+    summary = JSON.parse(readFileSync(summaryPath, 'utf-8'));
+  } catch {
+    summary = null;
   }
 
-  const recentMessages = getRecentMessages(sessionId, SUMMARY_MESSAGES);
+  const recentMessages = recentMessagesFor(sessionId, metadata, SUMMARY_MESSAGES);
 
   return {
     metadata,
@@ -293,11 +304,7 @@ export function getSessionContext(sessionId) {
  * Update session summary
  */
 export function updateSummary(sessionId, summary) {
-  ensureSessionsDir();
-  const sessionDir = getSessionDir(sessionId);
-  if (!existsSync(sessionDir)) {
-    mkdirSync(sessionDir, { recursive: true });
-  }
+  ensureDir(getSessionDir(sessionId));
 
   const summaryPath = getSummaryPath(sessionId);
   const summaryData = {
@@ -387,20 +394,15 @@ export function pruneOldSessions() {
       const sessionDir = getSessionDir(sessionId);
       const metadataPath = getMetadataPath(sessionId);
 
-      if (!existsSync(metadataPath)) continue;
-
       try {
         const metadata = JSON.parse(readFileSync(metadataPath, 'utf-8'));
         const lastUpdated = new Date(metadata.lastUpdated || metadata.createdAt).getTime();
 
         if (lastUpdated < cutoffTime) {
-          // Delete all files in session directory
-          const files = readdirSync(sessionDir);
-          for (const file of files) {
-            unlinkSync(join(sessionDir, file));
-          }
-          // Remove directory
-          rmdirSync(sessionDir);
+          // Remove the whole session directory in one call
+          rmSync(sessionDir, { recursive: true, force: true });
+          knownDirs.delete(sessionDir);
+          diskSizeCache.delete(sessionId);
           pruned++;
         }
       } catch {
@@ -431,10 +433,15 @@ export function getSessionStats(sessionId) {
   let totalSize = 0;
 
   try {
-    const files = readdirSync(sessionDir);
-    for (const file of files) {
-      const stats = statSync(join(sessionDir, file));
-      totalSize += stats.size;
+    const { mtimeNs } = statSync(sessionDir, { bigint: true });
+    const cached = diskSizeCache.get(sessionId);
+    if (cached && cached.mtimeNs === mtimeNs) {
+      totalSize = cached.size;
+    } else {
+      for (const file of readdirSync(sessionDir)) {
+        totalSize += statSync(join(sessionDir, file)).size;
+      }
+      diskSizeCache.set(sessionId, { mtimeNs, size: totalSize });
     }
   } catch {
     totalSize = 0;
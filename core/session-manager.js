@@ -153,10 +153,11 @@ function loadMetadata() {
   }
 }
 
-// Save session metadata
+// Save session metadata. Rewritten on every message (recordMessage) and read
+// only by this module, so it is stored compact rather than pretty-printed.
 function saveMetadata(metadata) {
   try {
-    atomicWriteFileSync(SESSION_META_FILE, JSON.stringify(metadata, null, 2));
+    atomicWriteFileSync(SESSION_META_FILE, JSON.stringify(metadata));
   } catch (error) {
     console.error('[SessionManager] Failed to save metadata:', error.message);
   }
@@ -26,6 +26,9 @@ const SUBAGENT_WORK_PATH = join(JOURNAL_DIR, 'subagent_work.jsonl');
 const MAX_SUBAGENTS = config.subagents?.maxConcurrent ?? 3;
 const DEFAULT_TIMEOUT = config.subagents?.defaultTimeoutMs ?? 300000; // 5 minutes
 
+// STATUS values a subagent may report in its output
+const RESULT_STATUSES = new Set(['completed', 'partial', 'blocked', 'failed']);
+
 // Active subagents
 const activeSubagents = new Map();
 const completedSubagents = new Map();
@@ -143,7 +146,7 @@ function parseSubagentOutput(output) {
 
   if (statusMatch) {
     const status = statusMatch[1].toLowerCase();
-    if (['completed', 'partial', 'blocked', 'failed'].includes(status)) {
+    if (RESULT_STATUSES.has(status)) {
       result.status = status;
     }
   }
@@ -234,12 +237,16 @@ export async function spawnSubagent(options) {
       let stdout = '';
       let stderr = '';
 
+      // Decode as a stream so multi-byte characters split across chunks survive
+      child.stdout.setEncoding('utf8');
+      child.stderr.setEncoding('utf8');
+
       child.stdout.on('data', (data) => {
-        stdout += data.toString();
+        stdout += data;
       });
 
       child.stderr.on('data', (data) => {
-        stderr += data.toString();
+        stderr += data;
       });
 
       return new Promise((resolve) => {
@@ -50,17 +50,21 @@ export function chunkMessage(text, maxLength = DEFAULT_MAX_LENGTH) {
 }
 
 /**
- * Find all code block positions in text.
- * Returns array of {start, end} for each fenced code block.
+ * Find fenced code block positions in text.
+ * Returns array of {start, end} for each fenced code block that starts
+ * before `limit`; blocks starting later can't affect a split within the
+ * first `limit` characters, so the scan stops there instead of walking the
+ * whole remaining message on every chunk.
  *
  * @param {string} text - Text to search
+ * @param {number} [limit=Infinity] - Stop at the first block starting at or after this index
  * @returns {Array<{start: number, end: number}>} Code block positions
  */
-function findCodeBlocks(text) {
+function findCodeBlocks(text, limit = Infinity) {
   const blocks = [];
   const regex = /```[\w]*\n[\s\S]*?```/g;
   let match;
-  while ((match = regex.exec(text)) !== null) {
+  while ((match = regex.exec(text)) !== null && match.index < limit) {
     blocks.push({ start: match.index, end: match.index + match[0].length });
   }
   return blocks;
@@ -93,7 +97,7 @@ function isInsideCodeBlock(position, codeBlocks) {
 function findSplitPoint(text, maxLength) {
   const searchArea = text.slice(0, maxLength);
   const minSplitPoint = Math.floor(maxLength * MIN_SPLIT_RATIO);
-  const codeBlocks = findCodeBlocks(text);
+  const codeBlocks = findCodeBlocks(text, maxLength);
 
   // Priority 0: Proactive code block preservation
   // Check if there's a code block we should try to keep intact
@@ -264,6 +268,22 @@ function findNaturalSplitPoint(searchArea, minSplitPoint, maxLength) {
   return maxLength;
 }
 
+/**
+ * Scan text once and return the end index of the last regex match.
+ * Walks the matches lazily instead of collecting them into an array.
+ *
+ * @param {string} text - Text to search
+ * @param {RegExp} regex - Global regex to match
+ * @returns {number} Index after the last match, or -1 if not found
+ */
+function lastMatchEnd(text, regex) {
+  let end = -1;
+  for (const match of text.matchAll(regex)) {
+    end = match.index + match[0].length;
+  }
+  return end;
+}
+
 /**
  * Find the last sentence-ending punctuation followed by whitespace or end.
  * Handles: . ! ? and also ellipsis (...)
@@ -274,11 +294,7 @@ function findNaturalSplitPoint(searchArea, minSplitPoint, maxLength) {
 function findLastSentenceEnd(text) {
   // Match sentence endings: . ! ? (including ellipsis) followed by space or end
   // Also handles quotes and parentheses after punctuation: ." ?) !"
-  const matches = [...text.matchAll(/[.!?]+['")\]]?(?:\s|$)/g)];
-  if (matches.length === 0) return -1;
-
-  const lastMatch = matches[matches.length - 1];
-  return lastMatch.index + lastMatch[0].length;
+  return lastMatchEnd(text, /[.!?]+['")\]]?(?:\s|$)/g);
 }
 
 /**
@@ -289,11 +305,7 @@ function findLastSentenceEnd(text) {
  */
 function findLastWordBoundary(text) {
   // Match any whitespace character
-  const matches = [...text.matchAll(/\s+/g)];
-  if (matches.length === 0) return -1;
-
-  const lastMatch = matches[matches.length - 1];
-  return lastMatch.index + lastMatch[0].length;
+  return lastMatchEnd(text, /\s+/g);
 }
 
 /**
@@ -305,11 +317,7 @@ function findLastWordBoundary(text) {
  */
 function findLastPunctuationBoundary(text) {
   // Match common split points in URLs and compound words: / - _ = & | , ;
-  const matches = [...text.matchAll(/[\/\-_=&|,;]+/g)];
-  if (matches.length === 0) return -1;
-
-  const lastMatch = matches[matches.length - 1];
-  return lastMatch.index + lastMatch[0].length;
+  return lastMatchEnd(text, /[\/\-_=&|,;]+/g);
 }
 
 /**
@@ -13,13 +13,29 @@ export const TOPIC_TYPES = {
   FOLLOWUP: 'followup',   // Continuation of previous topic
 };
 
+// Messages shorter than this (and without punctuation) skip LLM analysis
+const SIMPLE_MESSAGE_MAX_WORDS = 10;
+const WHITESPACE_RUN_RE = /\s+/g;
+
+/**
+ * Count whitespace-separated words the way split(/\s+/) would, stopping
+ * once `limit` is reached so long messages are not split into an array.
+ */
+function countWordsUpTo(text, limit) {
+  let count = 1;
+  for (const _ of text.matchAll(WHITESPACE_RUN_RE)) {
+    if (++count >= limit) break;
+  }
+  return count;
+}
+
 /**
  * Analyze a message and extract distinct topics
  */
 export async function analyzeTopics(message, userId) {
   // Quick check - if message is short and simple, skip analysis
-  const wordCount = message.split(/\s+/).length;
-  if (wordCount < 10 && !message.includes('?') && !message.includes('.')) {
+  const wordCount = countWordsUpTo(message, SIMPLE_MESSAGE_MAX_WORDS);
+  if (wordCount < SIMPLE_MESSAGE_MAX_WORDS && !message.includes('?') && !message.includes('.')) {
     return [{
       id: randomUUID(),
       content: message,
@@ -115,6 +131,9 @@ function fallbackParse(message) {
   }];
 }
 
+// Imperative openers that mark a topic as a task
+const TASK_PATTERN = /^(create|make|build|add|fix|update|deploy|run|test|install|write|implement|refactor|delete|remove|change|set|configure|check|review|help me)/i;
+
 /**
  * Detect topic type from simple patterns
  */
@@ -135,8 +154,7 @@ function detectSimpleType(text) {
   }
 
   // Tasks (imperative)
-  const taskPatterns = /^(create|make|build|add|fix|update|deploy|run|test|install|write|implement|refactor|delete|remove|change|set|configure|check|review|help me)/i;
-  if (taskPatterns.test(lower)) {
+  if (TASK_PATTERN.test(lower)) {
     return TOPIC_TYPES.TASK;
   }
 
@@ -4,12 +4,11 @@ import { config } from './config.js';
 import loop from './core/loop.js';
 import { conversations, tasks, goals, approvals, learnings } from './core/memory.js';
 import { query, chat, resetSessionState, createdSessions } from './core/claude.js';
-import { routeMessage, analyzeTopics, TOPIC_TYPES } from './core/topic-router.js';
-import { createAgentPool } from './core/agent-pool.js';
 import { wrapExternalContent, detectInjectionPatterns } from './core/security/external-content.js';
 import { initHooks, fireEvent } from './core/hooks.js';
 import { randomUUID } from 'crypto';
-import { existsSync, readFileSync, writeFileSync } from 'fs';
+import { existsSync, readFileSync } from 'fs';
+import { atomicWriteFileSync } from './core/atomic-write.js';
 
 // Content security configuration
 const CONTENT_SECURITY_ENABLED = process.env.FK_CONTENT_SECURITY_ENABLED !== '0';
@@ -21,12 +20,16 @@ let agentPool = null;
 // Store session IDs per user (persisted to file)
 const userSessions = new Map();
 const SESSIONS_FILE = './data/user_sessions.json';
+// Last content written to (or read from) SESSIONS_FILE, to skip no-op saves
+let lastSavedSessions = null;
 
 // Load saved sessions on startup
 function loadUserSessions() {
   try {
     if (existsSync(SESSIONS_FILE)) {
-      const data = JSON.parse(readFileSync(SESSIONS_FILE, 'utf-8'));
+      const raw = readFileSync(SESSIONS_FILE, 'utf-8');
+      const data = JSON.parse(raw);
+      lastSavedSessions = raw;
       for (const [userId, sessionId] of Object.entries(data)) {
         userSessions.set(userId, sessionId);
         // Mark as existing so we use --resume instead of --session-id
@@ -42,8 +45,10 @@ function loadUserSessions() {
 // Save sessions to file
 function saveUserSessions() {
   try {
-    const data = Object.fromEntries(userSessions);
-    writeFileSync(SESSIONS_FILE, JSON.stringify(data, null, 2));
+    const content = JSON.stringify(Object.fromEntries(userSessions), null, 2);
+    if (content === lastSavedSessions) return;
+    atomicWriteFileSync(SESSIONS_FILE, content);
+    lastSavedSessions = content;
   } catch (e) {
     console.error('[Sessions] Failed to save:', e.message);
   }
@@ -69,7 +74,6 @@ import { spawn } from 'child_process';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 import { checkAndUpdatePM2, isRunningUnderPM2 } from './scripts/pm2-utils.js';
-import { processChat as planChat } from './core/chat-planner.js';
 import innerLife from './core/inner-life.js';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
@@ -122,6 +126,8 @@ async function init() {
   // Initialize agent pool if enabled
   if (config.agentPool?.enabled) {
     console.log('[Init] Starting agent pool...');
+    // Loaded on demand: the pool and its worker plumbing are off by default
+    const { createAgentPool } = await import('./core/agent-pool.js');
     agentPool = createAgentPool({ poolSize: config.agentPool.size || 3 });
     await agentPool.initialize();
     setupAgentPoolListeners(agentPool);
@@ -276,15 +282,17 @@ async function startTelegramBot() {
   });
 }
 
+// Background task directive lines and the blank runs they leave behind
+const TASK_DIRECTIVE_RE = /^\[BACKGROUND_TASK:\s*(.+?)\]\s*$/gim;
+const EXTRA_BLANK_LINES_RE = /\n{3,}/g;
+
 // Parse Claude's response for background task directives
 function parseTaskDirectives(text) {
-  const taskPattern = /^\[BACKGROUND_TASK:\s*(.+?)\]\s*$/gim;
   const taskDescriptions = [];
-  let match;
-  while ((match = taskPattern.exec(text)) !== null) {
+  for (const match of text.matchAll(TASK_DIRECTIVE_RE)) {
     taskDescriptions.push(match[1].trim());
   }
-  const cleanReply = text.replace(taskPattern, '').replace(/\n{3,}/g, '\n\n').trim();
+  const cleanReply = text.replace(TASK_DIRECTIVE_RE, '').replace(EXTRA_BLANK_LINES_RE, '\n\n').trim();
   return { cleanReply, taskDescriptions };
 }
 
@@ -343,16 +351,19 @@ async function handleTelegramRequest(request) {
     case 'chat': {
       const { message, userId, replyToMessage } = params;
 
-      // DEBUG: Log incoming message details
-      console.log(`[Chat] ========== INCOMING MESSAGE ==========`);
-      console.log(`[Chat] User: ${userId}`);
-      console.log(`[Chat] Message length: ${message?.length || 0}`);
-      console.log(`[Chat] Message type: ${typeof message}`);
-      console.log(`[Chat] Full message: "${message}"`);
+      // DEBUG: Log incoming message details (one write for the whole block)
+      const debugLines = [
+        `[Chat] ========== INCOMING MESSAGE ==========`,
+        `[Chat] User: ${userId}`,
+        `[Chat] Message length: ${message?.length || 0}`,
+        `[Chat] Message type: ${typeof message}`,
+        `[Chat] Full message: "${message}"`,
+      ];
       if (replyToMessage) {
-        console.log(`[Chat] In reply to: "${replyToMessage.slice(0, 100)}..."`);
+        debugLines.push(`[Chat] In reply to: "${replyToMessage.slice(0, 100)}..."`);
       }
-      console.log(`[Chat] ========== END INCOMING ==========`);
+      debugLines.push(`[Chat] ========== END INCOMING ==========`);
+      console.log(debugLines.join('\n'));
 
       // Security: Wrap external content with safety markers
       let securedMessage = message;
@@ -1,6 +1,21 @@
 // Custom polling implementation that works with Node 23
 // Uses native fetch instead of Telegraf's internal HTTP client
 
+// getUpdates runs every poll cycle with the same filter; serialize it once
+const ALLOWED_UPDATES = JSON.stringify(['message']);
+
+// Serialized reaction payloads by emoji — the bot only uses a handful
+const reactionPayloads = new Map();
+
+function reactionPayload(emoji) {
+  let payload = reactionPayloads.get(emoji);
+  if (payload === undefined) {
+    payload = JSON.stringify([{ type: 'emoji', emoji }]);
+    reactionPayloads.set(emoji, payload);
+  }
+  return payload;
+}
+
 export class TelegramPoller {
   constructor(token, options = {}) {
     this.token = token;
@@ -53,7 +68,7 @@ export class TelegramPoller {
       return await this.callApi('setMessageReaction', {
         chat_id: chatId,
         message_id: messageId,
-        reaction: JSON.stringify([{ type: 'emoji', emoji: reaction }]),
+        reaction: reactionPayload(reaction),
       });
     } catch (e) {
       // Reactions might not be supported in all chats
@@ -65,7 +80,7 @@ export class TelegramPoller {
       offset: this.offset,
       timeout: this.timeout,
       limit: this.limit,
-      allowed_updates: JSON.stringify(['message']),
+      allowed_updates: ALLOWED_UPDATES,
     });
   }
 
@@ -2,10 +2,11 @@
 // Self-update script for Forgekeeper
 // Pulls latest changes from git and triggers a graceful restart
 
-import { spawn, execSync } from 'child_process';
+import { spawn, execSync, execFileSync } from 'child_process';
 import { existsSync, readFileSync, writeFileSync } from 'fs';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
+import { readRef } from '../core/git-refs.js';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const ROOT = join(__dirname, '..');
@@ -123,27 +124,33 @@ async function checkGitStatus() {
   }
 }
 
+/**
+ * Resolve a ref to a commit hash by reading .git directly, falling back to
+ * `git rev-parse` for layouts readRef doesn't handle (worktrees, symbolic
+ * remote refs). Avoids a git process per lookup on the common path.
+ * @param {string} ref - 'HEAD' or a full ref name such as 'refs/remotes/origin/main'
+ * @returns {string} commit hash
+ */
+function resolveRef(ref) {
+  return readRef(ref, ROOT)
+    ?? execFileSync('git', ['rev-parse', ref], { cwd: ROOT, encoding: 'utf8' }).trim();
+}
+
 async function checkIfBehind() {
   try {
-    const localCommit = execSync('git rev-parse HEAD', { cwd: ROOT, encoding: 'utf8' }).trim();
-    const remoteCommit = execSync(`git rev-parse ${config.remote}/${config.branch}`, { cwd: ROOT, encoding: 'utf8' }).trim();
+    const localCommit = resolveRef('HEAD');
+    const remoteCommit = resolveRef(`refs/remotes/${config.remote}/${config.branch}`);
 
     if (localCommit === remoteCommit) {
       return { needsUpdate: false, localCommit, remoteCommit };
     }
 
-    // Count commits behind
-    const countOutput = execSync(
-      `git rev-list --count HEAD..${config.remote}/${config.branch}`,
-      { cwd: ROOT, encoding: 'utf8' }
-    ).trim();
-    const commitsBehind = parseInt(countOutput) || 0;
-
-    // Get commit messages for what's coming
-    const changes = execSync(
-      `git log --oneline HEAD..${config.remote}/${config.branch}`,
+    // Commit messages for what's coming; one line per commit gives the count
+    const changes = execFileSync(
+      'git', ['log', '--oneline', `HEAD..${config.remote}/${config.branch}`],
       { cwd: ROOT, encoding: 'utf8' }
     ).trim();
+    const commitsBehind = changes ? changes.split('\n').length : 0;
 
     return {
       needsUpdate: commitsBehind > 0,
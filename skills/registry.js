@@ -5,6 +5,8 @@ import { pathToFileURL } from 'url';
 import { config } from '../config.js';
 
 const skills = new Map();
+// listSkills() result, rebuilt only after the registry changes
+let skillList = null;
 
 // Load all skills from the skills directory
 export async function loadSkills() {
@@ -17,21 +19,27 @@ export async function loadSkills() {
 
   const files = readdirSync(skillsDir).filter(f => f.endsWith('.js') && f !== 'registry.js');
 
-  for (const file of files) {
-    try {
-      const filePath = join(process.cwd(), skillsDir, file);
-      const fileUrl = pathToFileURL(filePath).href;
-      const module = await import(fileUrl);
-
-      if (module.default && module.default.name) {
-        const skill = module.default;
-        skills.set(skill.name, skill);
-        console.log(`  - Loaded skill: ${skill.name}`);
-      }
-    } catch (error) {
-      console.error(`[Skills] Failed to load ${file}:`, error.message);
+  // Import all skill modules concurrently so file reads and module compilation
+  // overlap, then register them in directory order
+  const results = await Promise.allSettled(files.map(file => {
+    const filePath = join(process.cwd(), skillsDir, file);
+    return import(pathToFileURL(filePath).href);
+  }));
+
+  results.forEach((result, i) => {
+    if (result.status === 'rejected') {
+      console.error(`[Skills] Failed to load ${files[i]}:`, result.reason?.message);
+      return;
     }
-  }
+
+    const module = result.value;
+    if (module.default && module.default.name) {
+      const skill = module.default;
+      skills.set(skill.name, skill);
+      skillList = null;
+      console.log(`  - Loaded skill: ${skill.name}`);
+    }
+  });
 
   return Array.from(skills.values());
 }
@@ -41,9 +49,10 @@ export function getSkill(name) {
   return skills.get(name);
 }
 
-// List all loaded skills
+// List all loaded skills (shared array — callers must not mutate it)
 export function listSkills() {
-  return Array.from(skills.values());
+  skillList ??= Array.from(skills.values());
+  return skillList;
 }
 
 // Register a skill dynamically (for self-extension)
@@ -56,6 +65,7 @@ export function registerSkill(skill) {
   }
 
   skills.set(skill.name, skill);
+  skillList = null;
   console.log(`[Skills] Registered: ${skill.name}`);
   return skill;
 }
@@ -64,6 +74,7 @@ export function registerSkill(skill) {
 export function unregisterSkill(name) {
   const removed = skills.delete(name);
   if (removed) {
+    skillList = null;
     console.log(`[Skills] Unregistered: ${name}`);
   }
   return removed;
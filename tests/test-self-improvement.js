@@ -12,6 +12,7 @@ import {
   checkTripwires,
   snapshotState,
   rollback,
+  runTestGate,
   generateDigest,
   getStats,
   pause,
@@ -266,6 +267,54 @@ async function runTests() {
     cleanupTestDir();
   });
 
+  await test('rollback restores only the listed files', async () => {
+    cleanupTestDir();
+    const fileA = join(TEST_DIR, 'test_a.txt');
+    const fileB = join(TEST_DIR, 'test_b.txt');
+    writeFileSync(fileA, 'content_a');
+    writeFileSync(fileB, 'content_b');
+
+    const snapshot = snapshotState([{ file: fileA }, { file: fileB }]);
+    writeFileSync(fileA, 'changed_a');
+    writeFileSync(fileB, 'changed_b');
+
+    rollback(snapshot, [fileA]);
+    assertEqual(readFileSync(fileA, 'utf-8'), 'content_a', 'File A should be restored');
+    assertEqual(readFileSync(fileB, 'utf-8'), 'changed_b', 'File B should be left alone');
+    cleanupTestDir();
+  });
+
+  // ===== Test Gate Tests =====
+  console.log('\n--- Test Gate Tests ---\n');
+
+  await test('runTestGate skips when no code files changed', async () => {
+    const result = await runTestGate([
+      { file: 'forgekeeper_personality/reflections/note.md', content: 'x' },
+      { file: 'skills/example/SKILL.md', content: 'y' },
+    ]);
+    assertEqual(result.passed, true, 'Skipped gate should pass');
+    assertEqual(result.skipped, true, 'Gate should be marked skipped');
+  });
+
+  await test('runTestGate fails when the test script does not exist', async () => {
+    // The default test command points at a runner script this tree doesn't ship
+    const result = await runTestGate([{ file: 'core/example.js', content: 'x' }]);
+    assertEqual(result.passed, false, 'Missing test script should fail the gate');
+    assert(!result.skipped, 'Missing test script should not count as skipped');
+    assert(!result.cached, 'Failed gate should not come from the cache');
+  });
+
+  await test('runTestGate leaves glob test paths to the runner', async () => {
+    const previous = config.selfImprovement.testCommand;
+    config.selfImprovement.testCommand = 'node --test ./tests/unit/git-*.test.js';
+    try {
+      const result = await runTestGate([{ file: 'core/example.js', content: 'glob' }]);
+      assert(!result.output.includes('not found'), 'Glob should not be reported as a missing script');
+    } finally {
+      config.selfImprovement.testCommand = previous;
+    }
+  });
+
   // ===== Digest Tests =====
   console.log('\n--- Digest Tests ---\n');
 
@@ -0,0 +1,65 @@
+// Tests for core/git-refs.js
+import { describe, it, before, after } from 'node:test';
+import assert from 'node:assert';
+import { existsSync, mkdirSync, rmSync, writeFileSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { findPackedRef, readRef } from '../../core/git-refs.js';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const TEST_REPO = join(__dirname, '..', 'test-data', 'git-refs');
+const GIT_DIR = join(TEST_REPO, '.git');
+
+const LOOSE_HASH = 'a'.repeat(40);
+const PACKED_HASH = 'b'.repeat(40);
+const REMOTE_HASH = 'c'.repeat(40);
+
+describe('Git Refs', () => {
+  before(() => {
+    mkdirSync(join(GIT_DIR, 'refs', 'heads'), { recursive: true });
+    writeFileSync(join(GIT_DIR, 'refs', 'heads', 'main'), `${LOOSE_HASH}\n`);
+    writeFileSync(join(GIT_DIR, 'packed-refs'), [
+      '# pack-refs with: peeled fully-peeled sorted',
+      `${PACKED_HASH} refs/heads/packed`,
+      `${REMOTE_HASH} refs/remotes/origin/main`,
+      '',
+    ].join('\n'));
+  });
+
+  after(() => {
+    if (existsSync(TEST_REPO)) {
+      rmSync(TEST_REPO, { recursive: true, force: true });
+    }
+  });
+
+  describe('findPackedRef', () => {
+    it('should match whole ref names only', () => {
+      const packed = `${PACKED_HASH} refs/heads/main-old\n${REMOTE_HASH} refs/heads/main`;
+      assert.strictEqual(findPackedRef(packed, 'refs/heads/main'), REMOTE_HASH);
+      assert.strictEqual(findPackedRef(packed, 'refs/heads/missing'), null);
+    });
+  });
+
+  describe('readRef', () => {
+    it('should follow a symbolic HEAD to its loose ref', () => {
+      writeFileSync(join(GIT_DIR, 'HEAD'), 'ref: refs/heads/main\n');
+      assert.strictEqual(readRef('HEAD', TEST_REPO), LOOSE_HASH);
+    });
+
+    it('should fall back to packed-refs', () => {
+      writeFileSync(join(GIT_DIR, 'HEAD'), 'ref: refs/heads/packed\n');
+      assert.strictEqual(readRef('HEAD', TEST_REPO), PACKED_HASH);
+      assert.strictEqual(readRef('refs/remotes/origin/main', TEST_REPO), REMOTE_HASH);
+    });
+
+    it('should return a detached HEAD as is', () => {
+      writeFileSync(join(GIT_DIR, 'HEAD'), `${REMOTE_HASH}\n`);
+      assert.strictEqual(readRef('HEAD', TEST_REPO), REMOTE_HASH);
+    });
+
+    it('should return null for refs it cannot resolve', () => {
+      assert.strictEqual(readRef('refs/heads/missing', TEST_REPO), null);
+      assert.strictEqual(readRef('HEAD', join(TEST_REPO, 'no-repo')), null);
+    });
+  });
+});
@@ -0,0 +1,152 @@
+// Tests for core/jsonl-rotate.js
+import { describe, it, before, after } from 'node:test';
+import assert from 'node:assert';
+import { existsSync, mkdirSync, rmSync, readFileSync, writeFileSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import {
+  appendJsonlRecord,
+  appendJsonlRecords,
+  releaseJsonlWriter,
+  closeJsonlWriters,
+  readJsonl,
+  readLastN,
+  truncateToLastN,
+} from '../../core/jsonl-rotate.js';
+import { atomicWriteFileSync } from '../../core/atomic-write.js';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const TEST_DIR = join(__dirname, '..', 'test-data', 'jsonl-rotate');
+
+function readLines(filePath) {
+  return readFileSync(filePath, 'utf-8').trim().split('\n').filter(Boolean).map(l => JSON.parse(l));
+}
+
+describe('JSONL Rotate', () => {
+  before(() => {
+    mkdirSync(TEST_DIR, { recursive: true });
+  });
+
+  after(() => {
+    closeJsonlWriters();
+    if (existsSync(TEST_DIR)) {
+      rmSync(TEST_DIR, { recursive: true, force: true });
+    }
+  });
+
+  describe('appendJsonlRecord', () => {
+    it('should append records as JSON lines', () => {
+      const file = join(TEST_DIR, 'append.jsonl');
+      appendJsonlRecord(file, { n: 1 });
+      appendJsonlRecord(file, { n: 2 });
+
+      assert.deepStrictEqual(readLines(file), [{ n: 1 }, { n: 2 }]);
+    });
+
+    it('should write to the new file after an in-process replace', () => {
+      const file = join(TEST_DIR, 'replace.jsonl');
+      appendJsonlRecord(file, { n: 1 });
+
+      atomicWriteFileSync(file, JSON.stringify({ n: 'rewritten' }) + '\n');
+      releaseJsonlWriter(file);
+      appendJsonlRecord(file, { n: 2 });
+
+      assert.deepStrictEqual(readLines(file), [{ n: 'rewritten' }, { n: 2 }]);
+    });
+
+    it('should append a batch of records in order', () => {
+      const file = join(TEST_DIR, 'batch.jsonl');
+      appendJsonlRecord(file, { n: 0 });
+      appendJsonlRecords(file, [{ n: 1 }, { n: 2 }, { n: 3 }]);
+      appendJsonlRecords(file, []);
+
+      assert.deepStrictEqual(readLines(file).map(r => r.n), [0, 1, 2, 3]);
+    });
+
+    it('should accept the sync option for immediate durability', () => {
+      const file = join(TEST_DIR, 'sync.jsonl');
+      appendJsonlRecord(file, { n: 1 }, { sync: true });
+      appendJsonlRecords(file, [{ n: 2 }], { sync: true });
+
+      assert.deepStrictEqual(readLines(file), [{ n: 1 }, { n: 2 }]);
+    });
+
+    it('should rotate once the size limit is reached', () => {
+      const file = join(TEST_DIR, 'rotate.jsonl');
+      for (let i = 0; i < 20; i++) {
+        appendJsonlRecord(file, { i, pad: 'x'.repeat(50) }, { maxBytes: 500 });
+      }
+
+      assert.ok(existsSync(`${file}.1`), 'Rotated copy should exist');
+      const current = readLines(file);
+      const rotated = readLines(`${file}.1`);
+      assert.strictEqual(current.at(-1).i, 19, 'Latest record should be in the current file');
+      assert.strictEqual(rotated.at(-1).i + 1, current[0]?.i ?? 20, 'Rotation should not drop records');
+    });
+  });
+
+  describe('truncateToLastN', () => {
+    it('should keep only the most recent lines', () => {
+      const file = join(TEST_DIR, 'truncate.jsonl');
+      writeFileSync(file, [1, 2, 3, 4, 5].map(n => JSON.stringify({ n })).join('\n') + '\n');
+
+      assert.strictEqual(truncateToLastN(file, 2), true);
+      assert.deepStrictEqual(readLines(file), [{ n: 4 }, { n: 5 }]);
+      assert.strictEqual(truncateToLastN(file, 2), false, 'Nothing left to drop');
+    });
+  });
+
+  describe('readJsonl', () => {
+    it('should parse every record and skip malformed lines', () => {
+      const file = join(TEST_DIR, 'read-all.jsonl');
+      writeFileSync(file, '{"n":1}\nnot json\n\n{"n":2}\n');
+
+      assert.deepStrictEqual(readJsonl(file), [{ n: 1 }, { n: 2 }]);
+      assert.deepStrictEqual(readJsonl(join(TEST_DIR, 'missing.jsonl')), []);
+    });
+
+    it('should not merge a line holding several values into the records', () => {
+      const file = join(TEST_DIR, 'read-multi.jsonl');
+      writeFileSync(file, '{"n":1}\n{"n":2},{"n":3}\n{"n":4}\n');
+
+      assert.deepStrictEqual(readJsonl(file), [{ n: 1 }, { n: 4 }]);
+    });
+  });
+
+  describe('readLastN', () => {
+    it('should return the last N records in file order', () => {
+      const file = join(TEST_DIR, 'tail.jsonl');
+      writeFileSync(file, [1, 2, 3, 4, 5].map(n => JSON.stringify({ n })).join('\n') + '\n');
+
+      assert.deepStrictEqual(readLastN(file, 2), [{ n: 4 }, { n: 5 }]);
+      assert.deepStrictEqual(readLastN(file, 10).length, 5);
+    });
+
+    it('should read across block boundaries in large files', () => {
+      const file = join(TEST_DIR, 'tail-large.jsonl');
+      const records = Array.from({ length: 5000 }, (_, i) => ({ i, text: 'ü'.repeat(i % 13) }));
+      writeFileSync(file, records.map(r => JSON.stringify(r)).join('\n') + '\n');
+
+      assert.deepStrictEqual(readLastN(file, 3000), records.slice(-3000));
+      assert.deepStrictEqual(readLastN(file, 1), records.slice(-1));
+    });
+
+    it('should only parse lines matching the includes prefilter', () => {
+      const file = join(TEST_DIR, 'tail-filter.jsonl');
+      const records = [
+        { type: 'thought', n: 1 },
+        { type: 'proactive_message', n: 2 },
+        { type: 'thought', n: 3 },
+        { type: 'proactive_message', n: 4 },
+      ];
+      writeFileSync(file, records.map(r => JSON.stringify(r)).join('\n') + '\n');
+
+      const matched = readLastN(file, 3, { includes: '"type":"proactive_message"' });
+      assert.deepStrictEqual(matched.map(r => r.n), [2, 4]);
+    });
+
+    it('should return an empty list for missing files', () => {
+      assert.deepStrictEqual(readLastN(join(TEST_DIR, 'missing.jsonl'), 5), []);
+    });
+  });
+});
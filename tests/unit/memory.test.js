@@ -92,6 +92,49 @@ describe('Memory Module', async () => {
       assert.ok(allPending.length >= 2, 'Should have at least 2 pending tasks');
     });
 
+    it('should create several tasks in one batch', async () => {
+      const { tasks } = await import('../../core/memory.js');
+
+      const created = tasks.createMany([
+        { description: 'Batch 1' },
+        { description: 'Batch 2', priority: 'high' },
+      ]);
+
+      assert.strictEqual(created.length, 2);
+      assert.strictEqual(tasks.get(created[1].id).priority, 'high');
+      const ids = tasks.pending().map(t => t.id);
+      assert.ok(created.every(t => ids.includes(t.id)), 'Batch tasks should be indexed');
+    });
+
+    it('should reflect status changes in repeated list calls', async () => {
+      const { tasks } = await import('../../core/memory.js');
+
+      const task = tasks.create({ description: 'Index cache task' });
+      assert.ok(tasks.pending().some(t => t.id === task.id), 'Should start pending');
+
+      tasks.update(task.id, { status: 'active' });
+
+      assert.ok(!tasks.pending().some(t => t.id === task.id), 'Should leave the pending list');
+      assert.ok(tasks.list({ status: 'active' }).some(t => t.id === task.id), 'Should be listed as active');
+    });
+
+    it('should compact the index after many status changes', async () => {
+      const { tasks } = await import('../../core/memory.js');
+      const { readFileSync } = await import('fs');
+
+      const task = tasks.create({ description: 'Frequently updated task' });
+      for (let i = 0; i < 200; i++) {
+        tasks.update(task.id, { status: i % 2 ? 'active' : 'blocked' });
+      }
+
+      const listed = tasks.list().filter(t => t.id === task.id);
+      assert.strictEqual(listed.length, 1, 'Task should be listed once');
+      assert.strictEqual(listed[0].status, 'active');
+
+      const lines = readFileSync(tasks.listPath(), 'utf-8').trim().split('\n');
+      assert.ok(lines.length < 200, 'Superseded status records should be compacted away');
+    });
+
     it('should add attempts to a task', async () => {
       const { tasks } = await import('../../core/memory.js');
 
@@ -107,6 +150,20 @@ describe('Memory Module', async () => {
     });
   });
 
+  describe('Conversations', async () => {
+    it('should return only the most recent messages when limited', async () => {
+      const { conversations } = await import('../../core/memory.js');
+
+      for (let i = 0; i < 8; i++) {
+        conversations.append('tail-user', { role: 'user', content: `msg ${i}` });
+      }
+
+      const recent = conversations.get('tail-user', 3);
+      assert.deepStrictEqual(recent.map(m => m.content), ['msg 5', 'msg 6', 'msg 7']);
+      assert.strictEqual(conversations.get('tail-user', 0).length, 8);
+    });
+  });
+
   describe('Goals', async () => {
     it('should create a goal with default values', async () => {
       const { goals } = await import('../../core/memory.js');